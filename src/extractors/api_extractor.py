@@ -11,9 +11,39 @@ Business Logic:
 """
 
 import requests
+import asyncio
+import hashlib
+import io
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
 import pandas as pd
+import os
 import time
 from typing import Optional, Dict, Any, List
+from src.utils.dtype_optimizer import optimize_dtypes
+
+try:
+    import aiohttp
+except ImportError:  # Async extraction is optional
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib JSON parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Responses are buffered and parsed in one go
+    ijson = None
+
+try:
+    import pyarrow.json as pa_json
+except ImportError:  # NDJSON is parsed row by row instead
+    pa_json = None
 
 
 class APIExtractor:
@@ -39,6 +69,57 @@ class APIExtractor:
         self.timeout = config.get('timeout', 30)
         self.retry_attempts = config.get('retry_attempts', 3)
         self.headers = config.get('headers', {})
+        
+        # Resolve every endpoint URL once instead of per request
+        self._urls = {
+            name: f"{self.base_url}{path}" for name, path in self.endpoints.items()
+        }
+        self.pool_size = config.get('pool_size', 10)
+        self.use_async = config.get('use_async', False)
+        self.cache_ttl = config.get('cache_ttl', 300)
+        self.stream_prefix = config.get('stream_prefix')
+        self.downcast = config.get('downcast', False)
+        self.categorical_columns = config.get('low_cardinality_cols', [])
+        
+        # Reuse one session so keep-alive connections are shared across
+        # attempts and endpoints instead of re-handshaking every request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=self._build_retry()
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Advertise every codec urllib3 can decode (gzip/deflate, plus br/zstd
+        # when brotli/zstandard are installed); bodies are decompressed as
+        # they stream off the socket
+        self.session.headers.update(make_headers(accept_encoding=True))
+        self.session.headers.update(self.headers)
+        
+        # Conditional-GET cache: {url: {'etag', 'last_modified', 'df', 'frame'}}.
+        # Validators live in the JSON cache_file; DataFrames are Parquet files
+        # in a sibling directory, read only when a 304 needs them
+        self.cache_file = config.get('cache_file')
+        self._frame_dir = (
+            os.path.splitext(self.cache_file)[0] + '_frames' if self.cache_file else None
+        )
+        self._response_cache = self._load_response_cache()
+        
+        # In-process results: {url: (expires_at, df)}, valid for cache_ttl seconds
+        self._result_cache = {}
+    
+    def close(self):
+        """Close the HTTP session and persist the response cache."""
+        self._save_response_cache()
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def extract(self, endpoint_name=None):
         """
@@ -74,103 +155,570 @@ class APIExtractor:
                 f"Available endpoints: {list(self.endpoints.keys())}"
             )
         
-        endpoint_path = self.endpoints[endpoint_name]
-        url = f"{self.base_url}{endpoint_path}"
+        url = self._urls[endpoint_name]
+        
+        memoized = self._get_memoized(url)
+        if memoized is not None:
+            self.logger.info(f"Using in-memory result for '{endpoint_name}'")
+            return memoized
         
         self.logger.info(f"Extracting data from API: {url}")
         
+        # Send validators from the last response so unchanged data costs a 304
+        cached = self._response_cache.get(url)
+        
+        stream = bool(self.stream_prefix) and ijson is not None
+        
         # Make API call with retry logic
-        data = self._make_request_with_retry(url)
+        response = self._make_request_with_retry(
+            url, headers=self._conditional_headers(cached), stream=stream
+        )
+        
+        if response.status_code == 304:
+            response.close()
+            df = self._cached_frame(url, cached)
+            if df is not None:
+                self.logger.info(f"'{endpoint_name}' not modified, using cached data")
+                return self._memoize(url, df)
+            
+            # A 304 has no body; without cached data ask again unconditionally
+            self.logger.warning(f"'{endpoint_name}' returned 304 with no cached data, re-requesting")
+            response = self._make_request_with_retry(url, headers={}, stream=stream)
+        
+        with response:
+            # Convert JSON to DataFrame
+            if stream:
+                df = self._stream_to_dataframe(response, endpoint_name)
+            else:
+                df = self._payload_to_dataframe(
+                    response.content,
+                    response.headers.get('Content-Type', ''),
+                    endpoint_name
+                )
+        
+        df = optimize_dtypes(df, self.downcast, self.categorical_columns, self.logger)
+        self._cache_response(url, response.headers, df)
+        
+        return self._memoize(url, df)
+    
+    def _get_memoized(self, url):
+        """
+        Get a result extracted earlier in this process, if still fresh.
+        
+        Args:
+            url (str): Request URL
+            
+        Returns:
+            pd.DataFrame or None: Cached DataFrame, or None if missing/expired
+        """
+        entry = self._result_cache.get(url)
+        if entry is None:
+            return None
         
-        # Convert JSON to DataFrame
-        df = self._json_to_dataframe(data, endpoint_name)
+        expires_at, df = entry
+        if time.monotonic() >= expires_at:
+            del self._result_cache[url]
+            return None
         
         return df
     
+    def _memoize(self, url, df):
+        """
+        Remember an extracted DataFrame for cache_ttl seconds.
+        
+        Args:
+            url (str): Request URL
+            df (pd.DataFrame): Extracted data
+            
+        Returns:
+            pd.DataFrame: The same DataFrame, for chaining
+        """
+        if self.cache_ttl > 0:
+            self._result_cache[url] = (time.monotonic() + self.cache_ttl, df)
+        return df
+    
+    def _conditional_headers(self, cached):
+        """
+        Build If-None-Match / If-Modified-Since headers from a cache entry.
+        
+        Args:
+            cached (dict, optional): Cache entry for the URL
+            
+        Returns:
+            dict: Conditional request headers (empty if nothing cached)
+        """
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def _cache_response(self, url, response_headers, df):
+        """
+        Remember a response's validators and DataFrame for conditional GETs.
+        
+        Args:
+            url (str): Request URL
+            response_headers: Response headers mapping
+            df (pd.DataFrame): Parsed response data
+        """
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if etag or last_modified:
+            self._response_cache[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'df': df,
+                'frame': None  # Not yet saved to disk
+            }
+    
+    def _cached_frame(self, url, cached):
+        """
+        Get the DataFrame for a 304 response, reading it from disk if needed.
+        
+        Args:
+            url (str): Request URL
+            cached (dict, optional): Cache entry the conditional GET was based on
+            
+        Returns:
+            pd.DataFrame or None: Cached data, or None if there is none usable
+        """
+        if not cached:
+            return None
+        if cached.get('df') is None and cached.get('frame'):
+            try:
+                cached['df'] = pd.read_parquet(os.path.join(self._frame_dir, cached['frame']))
+            except Exception as e:
+                self.logger.warning(f"Unreadable cached data for {url}: {e}")
+                self._response_cache.pop(url, None)
+                return None
+        return cached.get('df')
+    
     def _extract_all_endpoints(self):
         """
         Extract data from all configured endpoints.
         
+        Endpoints are independent and network-bound, so they are fetched
+        concurrently over the shared session (bounded by the pool size).
+        
         Returns:
             dict: Dictionary of DataFrames, keyed by endpoint name
         """
         self.logger.info(f"Extracting data from {len(self.endpoints)} API endpoints")
         
-        results = {}
+        if self.use_async and aiohttp is not None and self.endpoints:
+            return asyncio.run(self._extract_all_endpoints_async())
         
-        for endpoint_name in self.endpoints:
-            try:
-                df = self._extract_single_endpoint(endpoint_name)
-                results[endpoint_name] = df
-                self.logger.info(f"Successfully extracted '{endpoint_name}': {len(df)} records")
-            except Exception as e:
-                self.logger.error(f"Failed to extract '{endpoint_name}': {e}")
+        # Pre-populate so results keep the configured endpoint order
+        results = {endpoint_name: None for endpoint_name in self.endpoints}
+        if not self.endpoints:
+            return results
+        
+        max_workers = min(len(self.endpoints), self.pool_size)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._extract_single_endpoint, endpoint_name): endpoint_name
+                for endpoint_name in self.endpoints
+            }
+            
+            for future in as_completed(futures):
+                endpoint_name = futures[future]
+                try:
+                    df = future.result()
+                    results[endpoint_name] = df
+                    self.logger.info(f"Successfully extracted '{endpoint_name}': {len(df)} records")
+                except Exception as e:
+                    # Continue with other endpoints even if one fails
+                    self.logger.error(f"Failed to extract '{endpoint_name}': {e}")
+        
+        return results
+    
+    async def _extract_all_endpoints_async(self):
+        """
+        Extract data from all configured endpoints on a single event loop.
+        
+        Business Logic:
+        - Deployments with many small endpoints don't need a thread per call
+        - One aiohttp session multiplexes every request over keep-alive sockets
+        - Enabled with 'use_async: true' when aiohttp is installed
+        
+        Returns:
+            dict: Dictionary of DataFrames, keyed by endpoint name
+        """
+        connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=self.headers
+        ) as session:
+            frames = await asyncio.gather(
+                *[self._fetch(session, endpoint_name) for endpoint_name in self.endpoints],
+                return_exceptions=True
+            )
+        
+        results = {}
+        for endpoint_name, df in zip(self.endpoints, frames):
+            if isinstance(df, Exception):
                 # Continue with other endpoints even if one fails
+                self.logger.error(f"Failed to extract '{endpoint_name}': {df}")
                 results[endpoint_name] = None
+            else:
+                results[endpoint_name] = df
+                self.logger.info(f"Successfully extracted '{endpoint_name}': {len(df)} records")
         
         return results
     
-    def _make_request_with_retry(self, url, method='GET', max_retries=None):
+    async def _fetch(self, session, endpoint_name):
         """
-        Make HTTP request with retry logic.
+        Fetch one endpoint asynchronously with retry logic.
+        
+        Mirrors the synchronous path: conditional GETs against the response
+        cache, and retries on 429/5xx with exponential backoff that defers
+        to Retry-After.
         
         Args:
-            url (str): API URL
-            method (str): HTTP method (GET, POST, etc.)
-            max_retries (int): Maximum number of retry attempts
+            session (aiohttp.ClientSession): Shared client session
+            endpoint_name (str): Name of the endpoint
             
         Returns:
-            dict or list: JSON response data
+            pd.DataFrame: Extracted data
         """
-        if max_retries is None:
-            max_retries = self.retry_attempts
+        url = self._urls[endpoint_name]
+        
+        memoized = self._get_memoized(url)
+        if memoized is not None:
+            self.logger.info(f"Using in-memory result for '{endpoint_name}'")
+            return memoized
+        
+        cached = self._response_cache.get(url)
+        headers = self._conditional_headers(cached)
+        
+        self.logger.info(f"Extracting data from API: {url}")
         
         last_error = None
+        attempt = 0
         
-        for attempt in range(1, max_retries + 1):
+        while attempt <= self.retry_attempts:
+            if last_error is not None:
+                await asyncio.sleep(last_error[1])
+            backoff = 2 ** attempt
+            attempt += 1
+            
             try:
-                self.logger.debug(f"API request attempt {attempt}/{max_retries}: {url}")
-                
-                # Make the request
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-                
-                # Check if request was successful
-                response.raise_for_status()
-                
-                # Parse JSON response
-                data = response.json()
-                
-                self.logger.info(f"API request successful: {url}")
-                return data
-                
-            except requests.exceptions.Timeout:
-                last_error = f"Request timed out after {self.timeout} seconds"
-                self.logger.warning(f"Attempt {attempt} - {last_error}")
-                
-            except requests.exceptions.HTTPError as e:
-                last_error = f"HTTP error: {e}"
-                self.logger.warning(f"Attempt {attempt} - {last_error}")
-                
-            except requests.exceptions.RequestException as e:
-                last_error = f"Request error: {e}"
-                self.logger.warning(f"Attempt {attempt} - {last_error}")
-            
-            # Wait before retrying (exponential backoff)
-            if attempt < max_retries:
-                wait_time = 2 ** attempt  # 2, 4, 8 seconds
-                self.logger.info(f"Waiting {wait_time} seconds before retry...")
-                time.sleep(wait_time)
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        df = self._cached_frame(url, cached)
+                        if df is not None:
+                            self.logger.info(f"'{endpoint_name}' not modified, using cached data")
+                            return self._memoize(url, df)
+                        if headers:
+                            # A 304 has no body; ask again unconditionally
+                            # without using up a retry
+                            self.logger.warning(
+                                f"'{endpoint_name}' returned 304 with no cached data, re-requesting"
+                            )
+                            headers = {}
+                            attempt -= 1
+                            last_error = ("HTTP 304 without cached data", 0)
+                            continue
+                    
+                    if response.status in (429, 500, 502, 503, 504):
+                        retry_after = response.headers.get('Retry-After', '')
+                        delay = int(retry_after) if retry_after.isdigit() else backoff
+                        last_error = (f"HTTP error: {response.status}", delay)
+                        continue
+                    
+                    response.raise_for_status()
+                    payload = await response.read()
+                    
+                    df = self._payload_to_dataframe(
+                        payload,
+                        response.headers.get('Content-Type', ''),
+                        endpoint_name
+                    )
+                    df = optimize_dtypes(df, self.downcast, self.categorical_columns, self.logger)
+                    self._cache_response(url, response.headers, df)
+                    return self._memoize(url, df)
+                    
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = (f"Request error: {e!r}", backoff)
+        
+        raise Exception(
+            f"API request failed after {self.retry_attempts} retries. "
+            f"Last error: {last_error[0]}"
+        )
+    
+    def _stream_to_dataframe(self, response, endpoint_name):
+        """
+        Parse records incrementally while the response body downloads.
+        
+        Business Logic:
+        - Large payloads no longer wait for the full download before parsing
+        - The raw JSON text is never held in memory as a whole
+        - Enabled by setting 'stream_prefix' in config to the ijson path of
+          the records (e.g. 'item' for a top-level array, 'data.item' for
+          records wrapped in a 'data' key); requires ijson
+        
+        Args:
+            response (requests.Response): Response opened with stream=True
+            endpoint_name (str): Name of the endpoint (for logging)
+            
+        Returns:
+            pd.DataFrame: Converted data
+        """
+        # Let urllib3 undo any Content-Encoding while we read
+        response.raw.decode_content = True
+        
+        columns = {}
+        row_count = 0
+        
+        for record in ijson.items(response.raw, self.stream_prefix, use_float=True):
+            for key, value in record.items():
+                if key not in columns:
+                    # Backfill earlier rows for a column seen for the first time
+                    columns[key] = [None] * row_count
+                columns[key].append(value)
+            row_count += 1
+            
+            # Pad columns this record didn't have
+            for values in columns.values():
+                if len(values) < row_count:
+                    values.append(None)
+        
+        df = pd.DataFrame(columns, copy=False)
+        
+        rows, cols = df.shape
+        self.logger.info(
+            f"Converted '{endpoint_name}' to DataFrame: {rows} rows, {cols} columns"
+        )
+        
+        return df
+    
+    def _payload_to_dataframe(self, payload, content_type, endpoint_name):
+        """
+        Convert a raw response body to a DataFrame.
+        
+        Newline-delimited JSON (Content-Type containing 'ndjson'/'jsonl', or
+        'response_format: ndjson' in config) is decoded by PyArrow straight
+        into columnar buffers, skipping the intermediate list of dicts.
+        Regular JSON documents are parsed and then converted.
+        
+        Args:
+            payload (bytes): Response body
+            content_type (str): Response Content-Type header
+            endpoint_name (str): Name of the endpoint (for logging)
+            
+        Returns:
+            pd.DataFrame: Converted data
+        """
+        is_ndjson = (
+            self.config.get('response_format') == 'ndjson'
+            or 'ndjson' in content_type
+            or 'jsonl' in content_type
+        )
+        
+        if is_ndjson and pa_json is not None:
+            df = pa_json.read_json(io.BytesIO(payload)).to_pandas(
+                split_blocks=True, self_destruct=True
+            )
+            rows, cols = df.shape
+            self.logger.info(
+                f"Converted '{endpoint_name}' to DataFrame: {rows} rows, {cols} columns"
+            )
+            return df
+        
+        if is_ndjson:
+            data = [self._parse_json(line) for line in payload.splitlines() if line.strip()]
+        else:
+            data = self._parse_json(payload)
+        
+        return self._json_to_dataframe(data, endpoint_name)
+    
+    def _parse_json(self, payload):
+        """
+        Parse a raw JSON response body.
+        
+        Args:
+            payload (bytes): Response body
+            
+        Returns:
+            dict or list: Parsed JSON
+        """
+        if orjson is not None:
+            return orjson.loads(payload)
+        return json.loads(payload)
+    
+    def _make_request_with_retry(self, url, method='GET', headers=None, stream=False):
+        """
+        Make HTTP request with retry logic.
+        
+        Retries are handled by the session's mounted adapter (see
+        _build_retry), so transient failures back off inside the connection
+        pool and honor any Retry-After header sent by the server.
+        
+        Args:
+            url (str): API URL
+            method (str): HTTP method (GET, POST, etc.)
+            headers (dict, optional): Extra per-request headers
+            stream (bool): Defer downloading the body until it is read
+            
+        Returns:
+            requests.Response: Successful (2xx) or Not Modified (304) response
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"API request: {method} {url}")
+        
+        try:
+            # Make the request
+            response = self.session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                timeout=self.timeout,
+                stream=stream
+            )
+            
+            # Check if request was successful
+            response.raise_for_status()
+            
+            self.logger.info(f"API request successful: {url}")
+            return response
+            
+        except requests.exceptions.Timeout:
+            last_error = f"Request timed out after {self.timeout} seconds"
+            
+        except requests.exceptions.HTTPError as e:
+            last_error = f"HTTP error: {e}"
+            
+        except requests.exceptions.RequestException as e:
+            last_error = f"Request error: {e}"
         
         # All retries failed
-        error_msg = f"API request failed after {max_retries} attempts. Last error: {last_error}"
+        error_msg = (
+            f"API request failed after {self.retry_attempts} retries. "
+            f"Last error: {last_error}"
+        )
         self.logger.error(error_msg)
         raise Exception(error_msg)
     
+    def _build_retry(self):
+        """
+        Build the retry policy applied to every pooled connection.
+        
+        Business Logic:
+        - Only idempotent methods (GET, HEAD) are retried
+        - Rate limiting (429) and server errors (5xx) are retried with
+          exponential backoff: urllib3 2.x retries the first failure
+          at once, then waits 2, 4, 8... seconds (backoff_factor *
+          2 ** (retry - 1), capped at its 120 s backoff_max)
+        - Retry-After headers from the server take precedence
+        
+        Returns:
+            Retry: urllib3 retry configuration
+        """
+        return Retry(
+            total=self.retry_attempts,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    
+    def _load_response_cache(self):
+        """
+        Load cached response validators from a previous run.
+        
+        The cache is plain data (JSON validators and Parquet frames), so a
+        tampered cache file can't execute code. Frames are read lazily by
+        _cached_frame when a 304 needs them.
+        
+        Returns:
+            dict: Cache entries keyed by URL
+        """
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            cache = {
+                url: {
+                    'etag': entry.get('etag'),
+                    'last_modified': entry.get('last_modified'),
+                    'df': None,
+                    'frame': os.path.basename(entry['frame'])
+                }
+                for url, entry in index.items()
+            }
+            self.logger.debug(f"Loaded {len(cache)} cached API responses")
+            return cache
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable API cache '{self.cache_file}': {e}")
+            return {}
+    
+    def _save_response_cache(self):
+        """
+        Persist cached responses so the next run can send conditional GETs.
+        
+        New DataFrames are written as Parquet, one file per URL. Frames
+        that don't come back from Parquet unchanged (e.g. list columns
+        return as arrays) are left out, so a 304 never serves altered data.
+        """
+        if not self.cache_file or not self._response_cache:
+            return
+        
+        index = {}
+        try:
+            os.makedirs(self._frame_dir, exist_ok=True)
+            for url, entry in self._response_cache.items():
+                if entry.get('frame') is None:
+                    entry['frame'] = self._save_frame(url, entry['df'])
+                    if entry['frame'] is None:
+                        continue
+                index[url] = {
+                    'etag': entry.get('etag'),
+                    'last_modified': entry.get('last_modified'),
+                    'frame': entry['frame']
+                }
+            
+            tmp_path = f"{self.cache_file}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to save API cache '{self.cache_file}': {e}")
+    
+    def _save_frame(self, url, df):
+        """
+        Write one cached DataFrame to Parquet.
+        
+        Args:
+            url (str): Request URL (names the file)
+            df (pd.DataFrame): Parsed response data
+            
+        Returns:
+            str or None: File name inside the frame directory, or None if the
+                         frame can't be stored faithfully
+        """
+        name = hashlib.sha1(url.encode('utf-8')).hexdigest() + '.parquet'
+        path = os.path.join(self._frame_dir, name)
+        try:
+            df.to_parquet(path, index=True)
+            if pd.read_parquet(path).equals(df):
+                return name
+        except Exception as e:
+            self.logger.debug(f"Not caching {url}: {e}")
+        
+        if os.path.exists(path):
+            os.remove(path)
+        return None
+    
     def _json_to_dataframe(self, data, endpoint_name):
         """
         Convert JSON response to pandas DataFrame.
@@ -227,15 +775,13 @@ if __name__ == "__main__":
         # Set up logger
         logger = get_logger('api_extractor_test', log_config)
         
-        # Create extractor
-        extractor = APIExtractor(api_config, logger)
-        
         # Extract from all endpoints
         print("\n" + "="*80)
         print("API EXTRACTION TEST")
         print("="*80)
         
-        results = extractor.extract()
+        with APIExtractor(api_config, logger) as extractor:
+            results = extractor.extract()
         
         for endpoint_name, df in results.items():
             if df is not None:
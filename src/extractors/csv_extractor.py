@@ -11,8 +11,40 @@ Business Logic:
 """
 
 import pandas as pd
+import codecs
+import logging
 import os
+import queue
+import threading
 from typing import Optional
+from src.utils.dtype_optimizer import optimize_dtypes
+
+try:
+    from charset_normalizer import from_bytes
+except ImportError:  # Unknown encodings fall back to latin-1
+    from_bytes = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # Fall back to the pandas C parser
+    pa = None
+    pa_csv = None
+    pq = None
+
+# Parquet metadata key recording which CSV a mirror was parsed from
+_MIRROR_KEY = b'etl_source'
+# Bumped when parsing changes, so mirrors written by older code are re-parsed
+_MIRROR_VERSION = 2
+
+# Cells pandas.read_csv reads as missing by default; PyArrow is given the
+# same list so both parsers agree on blank and 'NA' text cells
+_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null'
+]
 
 
 class CSVExtractor:
@@ -36,6 +68,14 @@ class CSVExtractor:
         self.file_path = config.get('file_path')
         self.delimiter = config.get('delimiter', ',')
         self.encoding = config.get('encoding', 'utf-8')
+        self.block_size = config.get('block_size_mb', 8) * 1024 * 1024
+        self.chunk_size = config.get('chunk_size', 100000)
+        self.prefetch_chunks = config.get('prefetch_chunks', 2)
+        self.columns = config.get('columns')
+        self.dtypes = config.get('dtypes')
+        self.downcast = config.get('downcast', False)
+        self.categorical_columns = config.get('low_cardinality_cols', [])
+        self.parquet_mirror = config.get('parquet_mirror')
     
     def extract(self):
         """
@@ -56,34 +96,32 @@ class CSVExtractor:
             self.logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
+        # Sniff the encoding up front so a mismatch doesn't cost a full re-read
+        encoding = self._detect_encoding()
+        
         try:
             # Read CSV file
-            df = pd.read_csv(
-                self.file_path,
-                delimiter=self.delimiter,
-                encoding=self.encoding
-            )
+            df = self._read_csv(encoding)
+            df = optimize_dtypes(df, self.downcast, self.categorical_columns, self.logger)
             
             # Log success
             rows, cols = df.shape
             self.logger.info(f"CSV extraction successful: {rows} rows, {cols} columns")
             
             # Show a preview of the data (first 3 rows)
-            self.logger.debug(f"Data preview:\n{df.head(3)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Data preview:\n{df.head(3)}")
             
             return df
             
         except UnicodeDecodeError:
-            # Handle encoding issues
+            # Bad bytes beyond the sniffed sample - latin-1 decodes anything
             self.logger.warning(
-                f"Encoding '{self.encoding}' failed. Trying 'latin-1' encoding..."
+                f"Encoding '{encoding}' failed. Trying 'latin-1' encoding..."
             )
             try:
-                df = pd.read_csv(
-                    self.file_path,
-                    delimiter=self.delimiter,
-                    encoding='latin-1'
-                )
+                df = self._read_csv('latin-1')
+                df = optimize_dtypes(df, self.downcast, self.categorical_columns, self.logger)
                 rows, cols = df.shape
                 self.logger.info(
                     f"CSV extraction successful with 'latin-1': {rows} rows, {cols} columns"
@@ -99,6 +137,322 @@ class CSVExtractor:
             self.logger.error(error_msg)
             raise
     
+    def iter_extract(self, chunk_size=None):
+        """
+        Extract data from CSV file in chunks.
+        
+        Business Logic:
+        - Large files don't fit in memory as a single DataFrame
+        - Yielding chunks keeps memory bounded by the chunk size
+        - Downstream steps can start on the first chunk immediately
+        - The next chunks are parsed in the background while the caller
+          works on the current one (prefetch_chunks)
+        
+        Args:
+            chunk_size (int, optional): Rows per chunk. Uses config default if None.
+        
+        Yields:
+            pd.DataFrame: Chunk of extracted data
+            
+        Raises:
+            FileNotFoundError: If CSV file doesn't exist
+        """
+        rows_per_chunk = chunk_size or self.chunk_size
+        
+        self.logger.info(
+            f"Starting chunked CSV extraction from: {self.file_path} "
+            f"({rows_per_chunk} rows per chunk)"
+        )
+        
+        if not os.path.exists(self.file_path):
+            error_msg = f"CSV file not found: {self.file_path}"
+            self.logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+        
+        total_rows = 0
+        chunk_count = 0
+        encoding = self._detect_encoding()
+        
+        try:
+            reader = pd.read_csv(
+                self.file_path,
+                delimiter=self.delimiter,
+                encoding=encoding,
+                usecols=self.columns,
+                dtype=self.dtypes,
+                chunksize=rows_per_chunk,
+                engine='c',
+                memory_map=True
+            )
+            with reader:
+                for chunk in self._prefetch(reader):
+                    chunk = optimize_dtypes(
+                        chunk, self.downcast, self.categorical_columns, self.logger
+                    )
+                    total_rows += len(chunk)
+                    chunk_count += 1
+                    self.logger.debug(f"Read chunk {chunk_count}: {len(chunk)} rows")
+                    yield chunk
+                    
+        except Exception as e:
+            error_msg = f"Error reading CSV file in chunks: {e}"
+            self.logger.error(error_msg)
+            raise
+        
+        self.logger.info(
+            f"Chunked CSV extraction successful: {total_rows} rows in {chunk_count} chunks"
+        )
+    
+    def _prefetch(self, chunks):
+        """
+        Read ahead from a chunk iterator on a background thread.
+        
+        The pandas tokenizer releases the GIL, so upcoming chunks are parsed
+        while the caller is still cleaning the current one. At most
+        prefetch_chunks parsed chunks are buffered.
+        
+        Args:
+            chunks: Iterator of DataFrames
+            
+        Yields:
+            pd.DataFrame: The same chunks, in order
+        """
+        if self.prefetch_chunks <= 0:
+            yield from chunks
+            return
+        
+        buffer = queue.Queue(maxsize=self.prefetch_chunks)
+        stop = threading.Event()
+        done = object()
+        
+        def put(item):
+            # Give up if the consumer stopped iterating early
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce():
+            try:
+                for chunk in chunks:
+                    if not put(chunk):
+                        return
+            except BaseException as e:  # Re-raised in the consumer
+                put(e)
+            else:
+                put(done)
+        
+        thread = threading.Thread(target=produce, name='csv-prefetch', daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # The reader must not be in use when the caller closes it
+            stop.set()
+            thread.join()
+    
+    def _detect_encoding(self, sample_size=64 * 1024):
+        """
+        Pick the encoding to read the file with from a sample of its bytes.
+        
+        Business Logic:
+        - The configured encoding is kept if the sample decodes cleanly
+        - Otherwise charset-normalizer guesses from the sample (latin-1 if
+          it isn't installed or can't decide)
+        - Sniffing 64 KB is far cheaper than parsing the whole file, failing,
+          and parsing it again
+        
+        Args:
+            sample_size (int): Number of bytes to sample from the file start
+            
+        Returns:
+            str: Encoding name
+        """
+        with open(self.file_path, 'rb') as f:
+            sample = f.read(sample_size)
+        
+        try:
+            # Incremental decode tolerates a multi-byte char cut off at the end
+            codecs.getincrementaldecoder(self.encoding)().decode(sample, final=False)
+            return self.encoding
+        except UnicodeDecodeError:
+            pass
+        
+        detected = None
+        if from_bytes is not None:
+            best = from_bytes(sample).best()
+            detected = best.encoding if best else None
+        
+        encoding = detected or 'latin-1'
+        self.logger.warning(
+            f"CSV file is not valid '{self.encoding}', reading as '{encoding}'"
+        )
+        return encoding
+    
+    def _read_csv(self, encoding):
+        """
+        Read the CSV file with the fastest available parser.
+        
+        PyArrow tokenizes blocks of a memory-mapped file in parallel across
+        cores; pandas is used when PyArrow isn't installed. With a
+        parquet_mirror configured, an up-to-date Parquet copy is read
+        instead of parsing the CSV again.
+        
+        Args:
+            encoding (str): File encoding
+            
+        Returns:
+            pd.DataFrame: Parsed data
+            
+        Raises:
+            UnicodeDecodeError: If the file doesn't decode with this encoding
+        """
+        if pa_csv is None:
+            # Parse straight from the mapped file instead of copying it
+            # through a read buffer
+            return pd.read_csv(
+                self.file_path,
+                delimiter=self.delimiter,
+                encoding=encoding,
+                usecols=self.columns,
+                dtype=self.dtypes,
+                memory_map=True
+            )
+        
+        column_types, pandas_dtypes = self._split_dtypes()
+        
+        table = self._read_mirror()
+        if table is None:
+            # Memory-map the file so pages are faulted in on demand (and stay
+            # shared in the page cache across runs); blocks parse in parallel
+            with pa.memory_map(self.file_path, 'r') as source:
+                table = pa_csv.read_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(
+                        use_threads=True,
+                        encoding=encoding,
+                        block_size=self.block_size
+                    ),
+                    parse_options=pa_csv.ParseOptions(delimiter=self.delimiter),
+                    convert_options=pa_csv.ConvertOptions(
+                        include_columns=self.columns,
+                        column_types=column_types,
+                        null_values=_NA_VALUES,
+                        strings_can_be_null=True
+                    )
+                )
+            
+            # PyArrow falls back to binary columns instead of raising on bytes
+            # that aren't valid in the given encoding
+            for field in table.schema:
+                if pa.types.is_binary(field.type):
+                    raise UnicodeDecodeError(
+                        encoding, b'', 0, 1,
+                        f"invalid byte sequence in column '{field.name}'"
+                    )
+            
+            self._write_mirror(table)
+        
+        # Free each Arrow column as it's converted so peak memory stays ~1x
+        df = table.to_pandas(date_as_object=False, split_blocks=True, self_destruct=True)
+        del table
+        
+        # Dtypes PyArrow can't parse into directly (e.g. 'category')
+        if pandas_dtypes:
+            df = df.astype(pandas_dtypes)
+        
+        return df
+    
+    def _mirror_key(self):
+        """
+        Identify the CSV contents and parse settings a mirror depends on.
+        
+        Returns:
+            bytes: Key stored in (and compared against) the mirror's metadata
+        """
+        stat = os.stat(self.file_path)
+        return f"v{_MIRROR_VERSION}:{stat.st_mtime_ns}:{stat.st_size}:{self.delimiter}".encode()
+    
+    def _read_mirror(self):
+        """
+        Read the Parquet mirror of the CSV if it is still current.
+        
+        Only the configured columns are read from the mirror. Mirrors hold
+        the types PyArrow infers, so they're skipped when dtypes are set.
+        
+        Returns:
+            pa.Table: Mirrored data, or None if there is no usable mirror
+        """
+        if not self.parquet_mirror or pq is None or self.dtypes:
+            return None
+        
+        try:
+            metadata = pq.read_schema(self.parquet_mirror).metadata or {}
+            if metadata.get(_MIRROR_KEY) != self._mirror_key():
+                return None
+            table = pq.read_table(self.parquet_mirror, columns=self.columns, memory_map=True)
+        except (OSError, pa.ArrowException) as e:
+            self.logger.debug(f"Parquet mirror not used: {e}")
+            return None
+        
+        self.logger.info(f"Reading Parquet mirror: {self.parquet_mirror}")
+        return table
+    
+    def _write_mirror(self, table):
+        """
+        Save a freshly parsed CSV as the Parquet mirror.
+        
+        Only full parses with inferred types are mirrored, so the mirror can
+        serve any column selection later. A failed write is logged and the
+        extraction carries on.
+        
+        Args:
+            table (pa.Table): Parsed CSV
+        """
+        if not self.parquet_mirror or pq is None or self.columns or self.dtypes:
+            return
+        
+        tmp_path = f"{self.parquet_mirror}.tmp"
+        try:
+            mirror_dir = os.path.dirname(self.parquet_mirror)
+            if mirror_dir:
+                os.makedirs(mirror_dir, exist_ok=True)
+            metadata = dict(table.schema.metadata or {})
+            metadata[_MIRROR_KEY] = self._mirror_key()
+            pq.write_table(table.replace_schema_metadata(metadata), tmp_path, compression='zstd')
+            os.replace(tmp_path, self.parquet_mirror)
+            self.logger.debug(f"Wrote Parquet mirror: {self.parquet_mirror}")
+        except (OSError, pa.ArrowException) as e:
+            self.logger.warning(f"Could not write Parquet mirror: {e}")
+    
+    def _split_dtypes(self):
+        """
+        Split configured dtypes into ones PyArrow can parse directly
+        and ones that must be applied in pandas afterwards.
+        
+        Returns:
+            tuple: (dict of PyArrow types, dict of pandas dtypes)
+        """
+        column_types = {}
+        pandas_dtypes = {}
+        
+        for column, dtype in (self.dtypes or {}).items():
+            try:
+                column_types[column] = pa.type_for_alias(str(dtype))
+            except ValueError:
+                pandas_dtypes[column] = dtype
+        
+        return column_types, pandas_dtypes
+    
     def validate_file(self):
         """
         Validate that the CSV file exists and is readable.
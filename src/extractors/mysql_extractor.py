@@ -12,6 +12,7 @@ Business Logic:
 
 import pandas as pd
 from src.utils.db_connection import MySQLConnection
+from src.utils.dtype_optimizer import optimize_dtypes
 from typing import Optional
 
 
@@ -35,6 +36,10 @@ class MySQLExtractor:
         self.logger = logger
         self.db_connection = MySQLConnection(config, logger)
         self.table_name = config.get('table')
+        self.columns = config.get('columns')
+        self.dtypes = config.get('dtypes')
+        self.downcast = config.get('downcast', False)
+        self.categorical_columns = config.get('low_cardinality_cols', [])
     
     def extract(self, table_name=None, query=None):
         """
@@ -71,7 +76,13 @@ class MySQLExtractor:
         
         try:
             # Use the db_connection utility
-            df = self.db_connection.read_table(table_name)
+            df = self.db_connection.read_table(
+                table_name,
+                columns=self.columns,
+                dtypes=self.dtypes
+            )
+            
+            df = optimize_dtypes(df, self.downcast, self.categorical_columns, self.logger)
             
             rows, cols = df.shape
             self.logger.info(
@@ -105,6 +116,8 @@ class MySQLExtractor:
                 query=query
             )
             
+            df = optimize_dtypes(df, self.downcast, self.categorical_columns, self.logger)
+            
             rows, cols = df.shape
             self.logger.info(
                 f"MySQL query extraction successful: {rows} rows, {cols} columns"
@@ -12,6 +12,7 @@ Business Logic:
 
 import pandas as pd
 from src.utils.db_connection import PostgreSQLConnection
+from src.utils.dtype_optimizer import optimize_dtypes
 from typing import Optional
 
 
@@ -35,6 +36,11 @@ class PostgreSQLExtractor:
         self.logger = logger
         self.db_connection = PostgreSQLConnection(config, logger)
         self.table_name = config.get('table')
+        self.columns = config.get('columns')
+        self.dtypes = config.get('dtypes')
+        self.downcast = config.get('downcast', False)
+        self.categorical_columns = config.get('low_cardinality_cols', [])
+        self.chunk_size = config.get('chunk_size', 50000)
         self.schema = config.get('schema', 'public')
     
     def extract(self, table_name=None, schema=None, query=None):
@@ -60,6 +66,46 @@ class PostgreSQLExtractor:
         else:
             return self._extract_table(table, schema_name)
     
+    def iter_extract(self, table_name=None, schema=None, query=None, chunk_size=None):
+        """
+        Extract data from PostgreSQL in chunks using a server-side cursor.
+        
+        Args:
+            table_name (str, optional): Name of table to extract.
+                                       Uses config default if None.
+            schema (str, optional): Database schema. Uses config default if None.
+            query (str, optional): Custom SQL query.
+                                  If provided, executes this instead of reading table.
+            chunk_size (int, optional): Rows per chunk. Uses config default if None.
+        
+        Yields:
+            pd.DataFrame: Chunk of extracted data
+        """
+        table = table_name or self.table_name
+        schema_name = schema or self.schema
+        rows_per_chunk = chunk_size or self.chunk_size
+        
+        self.logger.info(
+            f"Starting chunked PostgreSQL extraction ({rows_per_chunk} rows per chunk)"
+        )
+        
+        try:
+            for chunk in self.db_connection.iter_table(
+                table_name=table,
+                schema=schema_name,
+                query=query,
+                columns=self.columns,
+                dtypes=self.dtypes,
+                chunk_size=rows_per_chunk
+            ):
+                yield optimize_dtypes(
+                    chunk, self.downcast, self.categorical_columns, self.logger
+                )
+        except Exception as e:
+            error_msg = f"Failed to stream from PostgreSQL: {e}"
+            self.logger.error(error_msg)
+            raise
+    
     def _extract_table(self, table_name, schema):
         """
         Extract entire table from PostgreSQL.
@@ -77,9 +123,13 @@ class PostgreSQLExtractor:
             # Use the db_connection utility
             df = self.db_connection.read_table(
                 table_name=table_name,
-                schema=schema
+                schema=schema,
+                columns=self.columns,
+                dtypes=self.dtypes
             )
             
+            df = optimize_dtypes(df, self.downcast, self.categorical_columns, self.logger)
+            
             rows, cols = df.shape
             self.logger.info(
                 f"PostgreSQL extraction successful: {rows} rows, {cols} columns "
@@ -115,6 +165,8 @@ class PostgreSQLExtractor:
                 query=query
             )
             
+            df = optimize_dtypes(df, self.downcast, self.categorical_columns, self.logger)
+            
             rows, cols = df.shape
             self.logger.info(
                 f"PostgreSQL query extraction successful: {rows} rows, {cols} columns"
@@ -12,8 +12,73 @@ Business Logic:
 
 import pandas as pd
 import os
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+from src.loaders.csv_loader import GZIP_OPTIONS
+from src.utils.counting_writer import CountingWriter
+from src.utils.dtype_optimizer import optimize_dtypes, find_low_cardinality_columns
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output requires pyarrow
+    pa = None
+    pc = None
+    ds = None
+    pq = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to DataFrame.to_json
+    orjson = None
+
+
+# Parquet writer defaults; override per deployment under 'parquet:' in config
+DEFAULT_PARQUET_OPTIONS = {
+    'compression': 'zstd',
+    'compression_level': 3,
+    'row_group_size': 256000,
+    'data_page_size': 1024 * 1024,
+    'use_dictionary': True,
+    'write_statistics': True
+}
+
+
+def _epoch_millis(table):
+    """
+    Replace datetime and duration columns with integer milliseconds.
+    
+    DataFrame.to_json writes datetimes as milliseconds since the epoch
+    (UTC for timezone-aware columns) and timedeltas as milliseconds,
+    rounding down; downstream readers of the NDJSON output expect that.
+    
+    Args:
+        table (pa.Table): Data to write
+        
+    Returns:
+        pa.Table: Table with timestamp/duration columns as int64 milliseconds
+    """
+    per_milli = {'s': None, 'ms': 1, 'us': 1000, 'ns': 1000000}
+    for i, field in enumerate(table.schema):
+        if not (pa.types.is_timestamp(field.type) or pa.types.is_duration(field.type)):
+            continue
+        values = pc.cast(table.column(i), pa.int64())
+        factor = per_milli[field.type.unit]
+        if factor is None:
+            values = pc.multiply(values, 1000)
+        elif factor > 1:
+            # Integer division truncates toward zero; step negatives down
+            quotient = pc.divide(values, factor)
+            remainder = pc.subtract(values, pc.multiply(quotient, factor))
+            values = pc.if_else(pc.less(remainder, 0), pc.subtract(quotient, 1), quotient)
+        table = table.set_column(i, field.name, values)
+    return table
+
 
 class CloudLoader:
     """
@@ -34,7 +99,20 @@ class CloudLoader:
         self.config = config
         self.logger = logger
         self.base_path = config.get('base_path', 'data/cloud_storage')
+        self._base_norm = self.base_path.rstrip('/')
         self.partition_by = config.get('partition_by', 'date')
+        self.parquet_opts = {**DEFAULT_PARQUET_OPTIONS, **config.get('parquet', {})}
+        self.partition_columns = config.get('partition_columns', [])
+        self.compression = config.get('compression', False)
+        self.compression_codec = config.get('compression_codec')
+        self.max_workers = config.get('max_workers', 32)
+        self.category_ratio = config.get('category_ratio', 0.5)
+        self.downcast = config.get('downcast', False)
+        self.parallel_threshold = config.get('parallel_threshold', 2000000)
+        self.parallel_workers = config.get('parallel_workers') or os.cpu_count() or 1
+        self._shard_pool = None
+        self._shard_pool_lock = threading.Lock()
+        self._known_dirs = set()
     
     def load(self, df, dataset_name="data", file_format="csv"):
         """
@@ -51,45 +129,35 @@ class CloudLoader:
             file_format (str): File format ('csv', 'parquet', 'json')
         
         Returns:
-            str: Path to uploaded file
+            str: Path to uploaded file. A large Parquet write split into
+                 shards returns the directory holding only that write's
+                 shards (<name>_<timestamp>/part000.parquet, ...), which
+                 Parquet readers load as one dataset.
         """
         self.logger.info(f"Uploading data to cloud storage: {dataset_name}")
         
-        # Create partition path
-        if self.partition_by == 'date':
-            now = datetime.now()
-            partition_path = os.path.join(
-                self.base_path,
-                dataset_name,
-                f"year={now.year}",
-                f"month={now.month:02d}",
-                f"day={now.day:02d}"
-            )
-        else:
-            partition_path = os.path.join(self.base_path, dataset_name)
+        # One clock read for both the partition and the filename
+        now = datetime.now()
+        partition_path = self._partition_path(dataset_name, now)
         
         # Create directory
-        os.makedirs(partition_path, exist_ok=True)
+        self._ensure_dir(partition_path)
         
         # Generate filename with timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{dataset_name}_{timestamp}.{file_format}"
-        file_path = os.path.join(partition_path, filename)
+        file_path = f"{partition_path}/{self._filename(dataset_name, now, file_format)}"
         
         try:
-            # Save based on format
-            if file_format == 'csv':
-                df.to_csv(file_path, index=False)
-            elif file_format == 'parquet':
-                df.to_parquet(file_path, index=False)
-            elif file_format == 'json':
-                df.to_json(file_path, orient='records', lines=True)
+            if file_format == 'parquet' and self._should_shard(df):
+                # The shards get their own directory: the partition also holds
+                # other formats and earlier runs that readers must not pick up
+                file_path = file_path[:-len('.parquet')]
+                bytes_written = self._write_parquet_shards(df, file_path)
             else:
-                raise ValueError(f"Unsupported file format: {file_format}")
+                bytes_written = self._write_one(df, file_path, file_format)
             
             # Log success
             rows, cols = df.shape
-            file_size = os.path.getsize(file_path) / 1024  # KB
+            file_size = bytes_written / 1024  # KB
             
             self.logger.info(
                 f"Cloud upload successful: {rows} rows, {cols} columns "
@@ -107,10 +175,573 @@ class CloudLoader:
             self.logger.error(error_msg)
             raise
     
+    def load_multi(self, df, dataset_name="data", formats=('csv', 'parquet', 'json')):
+        """
+        Upload the same DataFrame in several file formats.
+        
+        Business Logic:
+        - Archival often needs one dataset in several formats
+        - The frame is converted to Arrow once and the Parquet and JSON
+          files are written from that table; CSV is written by pandas,
+          whose quoting and number format CSV readers expect
+        - All files share one partition and timestamp
+        
+        Args:
+            df (pd.DataFrame): Data to upload
+            dataset_name (str): Name of the dataset
+            formats (iterable): File formats ('csv', 'parquet', 'json')
+        
+        Returns:
+            dict: Uploaded file path per format
+        """
+        if pa is None:
+            return {fmt: self.load(df, dataset_name, fmt) for fmt in formats}
+        
+        self.logger.info(
+            f"Uploading data to cloud storage: {dataset_name} "
+            f"(formats: {', '.join(formats)})"
+        )
+        
+        now = datetime.now()
+        partition_path = self._partition_path(dataset_name, now)
+        self._ensure_dir(partition_path)
+        
+        try:
+            table = pa.Table.from_pandas(
+                self._prepare(self._downcast(df)), preserve_index=False
+            )
+            
+            paths = {}
+            for file_format in formats:
+                file_path = f"{partition_path}/{self._filename(dataset_name, now, file_format)}"
+                try:
+                    if file_format == 'csv':
+                        # Arrow's CSV writer quotes all text, so CSV keeps to_csv's format
+                        bytes_written = self._write_one(df, file_path, file_format)
+                    else:
+                        bytes_written = self._write_arrow(table, file_path, file_format)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+                    self.logger.debug(f"Arrow {file_format} writer unavailable for this data: {e}")
+                    bytes_written = self._write_one(df, file_path, file_format)
+                
+                self.logger.info(
+                    f"Cloud upload successful: {table.num_rows} rows, {table.num_columns} "
+                    f"columns ({bytes_written / 1024:.2f} KB) -> {file_path}"
+                )
+                paths[file_format] = file_path
+            
+            return paths
+            
+        except Exception as e:
+            error_msg = f"Failed to upload to cloud storage: {e}"
+            self.logger.error(error_msg)
+            raise
+    
+    def load_many(self, df, partition_col, dataset_name="data", file_format="parquet"):
+        """
+        Upload one file per value of a column, writing partitions concurrently.
+        
+        Business Logic:
+        - Against real object storage each file is a separate PUT, so
+          uploading partitions in parallel hides per-request latency
+        - Locally, serialization of one partition overlaps disk writes
+          of another (pyarrow and compression release the GIL)
+        - Layout: <dataset>/year=/month=/day=/<partition_col>=<value>/
+        
+        Args:
+            df (pd.DataFrame): Data to upload
+            partition_col (str): Column whose values split the files
+            dataset_name (str): Name of the dataset
+            file_format (str): File format ('csv', 'parquet', 'json')
+        
+        Returns:
+            list: Paths of uploaded files
+        """
+        self.logger.info(
+            f"Uploading data to cloud storage: {dataset_name} "
+            f"(one file per '{partition_col}')"
+        )
+        
+        now = datetime.now()
+        base_path = self._partition_path(dataset_name, now)
+        filename = self._filename(dataset_name, now, file_format)
+        
+        jobs = []
+        for value, group in df.groupby(partition_col, sort=False, dropna=False, observed=True):
+            # Hive's placeholder for null partition values
+            value = '__HIVE_DEFAULT_PARTITION__' if pd.isna(value) else value
+            partition_path = f"{base_path}/{partition_col}={value}"
+            self._ensure_dir(partition_path)
+            jobs.append((group, f"{partition_path}/{filename}"))
+        
+        if not jobs:
+            self.logger.warning(f"No rows to upload for {dataset_name}")
+            return []
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+                futures = [
+                    executor.submit(self._write_one, group, file_path, file_format)
+                    for group, file_path in jobs
+                ]
+                bytes_written = sum(future.result() for future in as_completed(futures))
+            
+            self.logger.info(
+                f"Cloud upload successful: {len(df)} rows in {len(jobs)} files "
+                f"({bytes_written / 1024:.2f} KB) -> {base_path}"
+            )
+            
+            return [file_path for _, file_path in jobs]
+            
+        except Exception as e:
+            error_msg = f"Failed to upload to cloud storage: {e}"
+            self.logger.error(error_msg)
+            raise
+    
+    def load_partitioned(self, df, dataset_name="data", partition_columns=None):
+        """
+        Load DataFrame as a Hive-partitioned Parquet dataset.
+        
+        Business Logic:
+        - Partition directories come from the data itself, e.g.
+          year=2024/month=11/day=29/region=EU/
+        - Date partitions (if partition_by is 'date') use the load date,
+          matching load(); extra dimensions come from data columns
+        - One pyarrow call writes every partition, and readers can prune
+          partitions they don't need
+        
+        Args:
+            df (pd.DataFrame): Data to upload
+            dataset_name (str): Name of the dataset
+            partition_columns (list, optional): Data columns to partition by.
+                                               Uses config default if None.
+        
+        Returns:
+            str: Path to the dataset root
+        """
+        if ds is None:
+            raise ImportError("pyarrow not installed. Run: pip install pyarrow")
+        
+        columns = partition_columns if partition_columns is not None else self.partition_columns
+        dataset_path = f"{self._base_norm}/{dataset_name}"
+        now = datetime.now()
+        
+        self.logger.info(
+            f"Uploading partitioned dataset to cloud storage: {dataset_name} "
+            f"(partitions: {columns or 'none'})"
+        )
+        
+        try:
+            table = pa.Table.from_pandas(self._downcast(df), preserve_index=False)
+            partition_fields = []
+            
+            if self.partition_by == 'date':
+                # Zero-padded strings keep the same layout as load()
+                for name, value in (
+                    ('year', f"{now.year}"),
+                    ('month', f"{now.month:02d}"),
+                    ('day', f"{now.day:02d}")
+                ):
+                    table = table.append_column(
+                        name, pa.array([value] * table.num_rows, pa.string())
+                    )
+                    partition_fields.append(pa.field(name, pa.string()))
+            
+            for column in columns:
+                partition_fields.append(table.schema.field(column))
+            
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
+            options = dict(self.parquet_opts)
+            row_group_size = options.pop('row_group_size')
+            
+            ds.write_dataset(
+                table,
+                dataset_path,
+                format='parquet',
+                partitioning=ds.partitioning(pa.schema(partition_fields), flavor='hive'),
+                basename_template=f"{dataset_name}_{timestamp}_{{i}}.parquet",
+                existing_data_behavior='overwrite_or_ignore',
+                max_rows_per_group=row_group_size,
+                file_options=ds.ParquetFileFormat().make_write_options(**options)
+            )
+            
+            rows, cols = df.shape
+            self.logger.info(
+                f"Partitioned upload successful: {rows} rows, {cols} columns -> {dataset_path}"
+            )
+            
+            return dataset_path
+            
+        except Exception as e:
+            error_msg = f"Failed to upload partitioned dataset: {e}"
+            self.logger.error(error_msg)
+            raise
+    
+    def _ensure_dir(self, path):
+        """
+        Create a directory once per loader; later writes skip the filesystem check.
+        
+        Args:
+            path (str): Directory to create
+        """
+        if path not in self._known_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._known_dirs.add(path)
+    
+    def _partition_path(self, dataset_name, now):
+        """
+        Build the directory a dataset is written to for a load time.
+        
+        Args:
+            dataset_name (str): Name of the dataset
+            now (datetime): Load time
+            
+        Returns:
+            str: Partition directory
+        """
+        if self.partition_by == 'date':
+            return (
+                f"{self._base_norm}/{dataset_name}/year={now.year}/"
+                f"month={now.month:02d}/day={now.day:02d}"
+            )
+        return f"{self._base_norm}/{dataset_name}"
+    
+    def _filename(self, dataset_name, now, file_format):
+        """
+        Build a timestamped filename for a dataset.
+        
+        Args:
+            dataset_name (str): Name of the dataset
+            now (datetime): Load time
+            file_format (str): File format ('csv', 'parquet', 'json')
+            
+        Returns:
+            str: Filename, with .lz4/.gz appended for compressed output
+        """
+        filename = f"{dataset_name}_{now.strftime('%Y%m%d_%H%M%S')}.{file_format}"
+        if self._uses_lz4(file_format):
+            filename = f"{filename}.lz4"
+        elif file_format == 'csv' and self.compression:
+            filename = f"{filename}.gz"
+        return filename
+    
+    def _uses_lz4(self, file_format):
+        """
+        Check whether a text format is written LZ4-compressed.
+        
+        Business Logic:
+        - LZ4 decodes several times faster than gzip at a somewhat larger
+          size, which suits hand-off files that are read straight back
+        - Enabled with compression_codec: lz4; applies to CSV and JSON
+        
+        Args:
+            file_format (str): File format ('csv', 'parquet', 'json')
+            
+        Returns:
+            bool: True if the file should be LZ4-compressed
+        """
+        return self.compression_codec == 'lz4' and file_format in ('csv', 'json')
+    
+    def _open_stream(self, sink, file_format):
+        """
+        Wrap a sink in an LZ4 frame stream when the format calls for it.
+        
+        Args:
+            sink: Writable binary stream
+            file_format (str): File format ('csv', 'parquet', 'json')
+            
+        Returns:
+            Context manager yielding the stream to write to
+        """
+        if not self._uses_lz4(file_format):
+            return nullcontext(sink)
+        if pa is None:
+            raise ImportError("pyarrow not installed. Run: pip install pyarrow")
+        # Arrow's lz4 stream codec writes the standard LZ4 frame format
+        return pa.CompressedOutputStream(sink, 'lz4')
+    
+    def _write_one(self, df, file_path, file_format):
+        """
+        Write a DataFrame to a single file in the given format.
+        
+        Args:
+            df (pd.DataFrame): Data to write
+            file_path (str): Destination path
+            file_format (str): File format ('csv', 'parquet', 'json')
+            
+        Returns:
+            int: Bytes written to disk
+        """
+        df = self._downcast(df)
+        
+        if file_format == 'csv':
+            with open(file_path, 'wb') as raw:
+                sink = CountingWriter(raw)
+                if self._uses_lz4(file_format):
+                    with self._open_stream(sink, file_format) as stream:
+                        df.to_csv(stream, mode='wb', index=False)
+                else:
+                    df.to_csv(
+                        sink,
+                        mode='wb',
+                        index=False,
+                        compression=GZIP_OPTIONS if self.compression else None
+                    )
+            return sink.bytes_written
+        elif file_format == 'parquet':
+            return self._write_parquet(df, file_path)
+        elif file_format == 'json':
+            return self._write_ndjson(df, file_path)
+        else:
+            raise ValueError(f"Unsupported file format: {file_format}")
+    
+    def _write_arrow(self, table, file_path, file_format):
+        """
+        Write an Arrow table to a single file in the given format.
+        
+        Args:
+            table (pa.Table): Data to write
+            file_path (str): Destination path
+            file_format (str): File format ('parquet', 'json')
+            
+        Returns:
+            int: Bytes written to disk
+        """
+        if file_format == 'parquet':
+            return self._write_parquet_table(table, file_path)
+        if file_format != 'json':
+            raise ValueError(f"Unsupported file format: {file_format}")
+        if orjson is None:
+            raise ValueError("orjson not installed; cannot write JSON from Arrow")
+        
+        with open(file_path, 'wb') as raw:
+            sink = CountingWriter(raw)
+            if self._uses_lz4(file_format):
+                with self._open_stream(sink, file_format) as stream:
+                    self._write_ndjson_batches(table, stream)
+            else:
+                self._write_ndjson_batches(table, sink)
+        
+        return sink.bytes_written
+    
+    def _should_shard(self, df):
+        """
+        Check whether a Parquet write is large enough to split across threads.
+        
+        Args:
+            df (pd.DataFrame): Data to write
+            
+        Returns:
+            bool: True if the frame should be written as parallel shards
+        """
+        return (
+            pq is not None
+            and bool(self.parallel_threshold)
+            and self.parallel_workers > 1
+            and len(df) > self.parallel_threshold
+        )
+    
+    def _write_parquet_shards(self, df, shard_dir):
+        """
+        Write a large DataFrame as several Parquet files in parallel threads.
+        
+        Business Logic:
+        - ZSTD compression is CPU-bound and a single writer uses one core
+        - The frame is converted to Arrow once; equal row ranges of the
+          table (zero-copy slices) are encoded and compressed on the
+          loader's shard pool, which releases the GIL, and saved as
+          part000.parquet, part001.parquet, ... in shard_dir
+        - One bounded pool serves every write, so concurrent load_many
+          partitions share parallel_workers threads instead of each
+          starting their own
+        - Parquet readers treat shard_dir as one dataset, so it must hold
+          nothing but this write's shards
+        
+        Args:
+            df (pd.DataFrame): Data to write
+            shard_dir (str): New directory for the shards
+            
+        Returns:
+            int: Bytes written to disk across all shards
+        """
+        table = pa.Table.from_pandas(self._prepare(self._downcast(df)), preserve_index=False)
+        
+        shard_count = self.parallel_workers
+        shard_rows = -(-table.num_rows // shard_count)  # ceiling division
+        os.makedirs(shard_dir, exist_ok=True)
+        
+        shards = [
+            (table.slice(start, shard_rows), os.path.join(shard_dir, f"part{i:03d}.parquet"))
+            for i, start in enumerate(range(0, table.num_rows, shard_rows))
+        ]
+        
+        self.logger.info(f"Writing {len(shards)} Parquet shards in parallel")
+        
+        executor = self._shard_executor()
+        return sum(executor.map(lambda shard: self._write_parquet_table(*shard), shards))
+    
+    def _shard_executor(self):
+        """
+        Return the loader's shard thread pool, creating it on first use.
+        
+        Returns:
+            ThreadPoolExecutor: Pool of parallel_workers threads
+        """
+        with self._shard_pool_lock:
+            if self._shard_pool is None:
+                self._shard_pool = ThreadPoolExecutor(
+                    max_workers=self.parallel_workers,
+                    thread_name_prefix='parquet-shard'
+                )
+            return self._shard_pool
+    
+    def _write_parquet(self, df, file_path):
+        """
+        Write a DataFrame to Parquet with tuned compression and row groups.
+        
+        Business Logic:
+        - ZSTD gives much smaller files than the default at similar speed
+        - Large row groups and dictionary encoding help downstream
+          readers skip data using column statistics
+        - Repeated strings are written as categories (see _prepare)
+        
+        Args:
+            df (pd.DataFrame): Data to write
+            file_path (str): Destination path
+            
+        Returns:
+            int: Bytes written to disk
+        """
+        df = self._prepare(df)
+        
+        if pq is None:
+            raise ImportError("pyarrow not installed. Run: pip install pyarrow")
+        
+        return self._write_parquet_table(pa.Table.from_pandas(df, preserve_index=False), file_path)
+    
+    def _write_parquet_table(self, table, file_path):
+        """
+        Write an Arrow table to Parquet with the configured writer options.
+        
+        Args:
+            table (pa.Table): Data to write
+            file_path (str): Destination path
+            
+        Returns:
+            int: Bytes written to disk
+        """
+        options = dict(self.parquet_opts)
+        row_group_size = options.pop('row_group_size')
+        
+        with open(file_path, 'wb') as raw:
+            sink = CountingWriter(raw)
+            pq.write_table(table, sink, row_group_size=row_group_size, **options)
+        return sink.bytes_written
+    
+    def _downcast(self, df):
+        """
+        Narrow numeric columns before writing, leaving the caller's frame as-is.
+        
+        Args:
+            df (pd.DataFrame): Data to write
+            
+        Returns:
+            pd.DataFrame: Data with the smallest numeric dtypes that fit
+        """
+        if not self.downcast:
+            return df
+        return optimize_dtypes(df.copy(deep=False), logger=self.logger)
+    
+    def _prepare(self, df):
+        """
+        Convert low-cardinality string columns to categories before a Parquet write.
+        
+        Categoricals become Arrow dictionary arrays, so each distinct string
+        is encoded once and rows store small integer codes. The caller's
+        DataFrame is left unchanged.
+        
+        Args:
+            df (pd.DataFrame): Data to write
+            
+        Returns:
+            pd.DataFrame: Data with repeated strings as categories
+        """
+        if not self.category_ratio:
+            return df
+        
+        columns = find_low_cardinality_columns(df, self.category_ratio)
+        if not columns:
+            return df
+        
+        return optimize_dtypes(
+            df.copy(deep=False),
+            downcast=False,
+            categorical_columns=columns,
+            logger=self.logger
+        )
+    
+    def _write_ndjson(self, df, file_path, batch_size=64000):
+        """
+        Write a DataFrame as newline-delimited JSON.
+        
+        Business Logic:
+        - orjson serializes each record in native code, several times
+          faster than pandas' JSON writer
+        - Rows are converted and written one Arrow batch at a time, so
+          only one batch of Python dicts exists at once
+        - Falls back to to_json when orjson or pyarrow isn't installed
+        
+        Args:
+            df (pd.DataFrame): Data to write
+            file_path (str): Destination path
+            batch_size (int): Rows serialized per write
+            
+        Returns:
+            int: Bytes written to disk
+        """
+        table = None
+        if orjson is not None and pa is not None:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+                self.logger.debug(f"Arrow conversion unavailable for this data: {e}")
+        
+        with open(file_path, 'wb') as raw:
+            sink = CountingWriter(raw)
+            
+            with self._open_stream(sink, 'json') as stream:
+                if table is None:
+                    df.to_json(stream, orient='records', lines=True)
+                else:
+                    self._write_ndjson_batches(table, stream, batch_size)
+        
+        return sink.bytes_written
+    
+    def _write_ndjson_batches(self, table, sink, batch_size=64000):
+        """
+        Serialize an Arrow table to an open stream as NDJSON with orjson.
+        
+        Args:
+            table (pa.Table): Data to write
+            sink: Writable binary stream
+            batch_size (int): Rows serialized per write
+        """
+        table = _epoch_millis(table)
+        for batch in table.to_batches(max_chunksize=batch_size):
+            records = batch.to_pylist()
+            if not records:
+                continue
+            sink.write(b'\n'.join(orjson.dumps(record, default=str) for record in records))
+            sink.write(b'\n')
+    
     def list_partitions(self, dataset_name):
         """
         List all partitions for a dataset.
         
+        A partition is a directory that holds files. Scanning stops at the
+        first file in a directory, so large partitions cost one directory
+        read instead of a stat per file.
+        
         Args:
             dataset_name (str): Name of the dataset
             
@@ -119,13 +750,29 @@ class CloudLoader:
         """
         dataset_path = os.path.join(self.base_path, dataset_name)
         
-        if not os.path.exists(dataset_path):
+        if not os.path.isdir(dataset_path):
             return []
         
         partitions = []
-        for root, dirs, files in os.walk(dataset_path):
-            if files:  # Directory contains files
-                partitions.append(root)
+        stack = [dataset_path]
+        while stack:
+            directory = stack.pop()
+            subdirs = []
+            has_file = False
+            
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        has_file = True
+                        break
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
+            
+            if has_file:
+                partitions.append(directory)
+            else:
+                # Reversed so partitions come out in directory order
+                stack.extend(sorted(subdirs, reverse=True))
         
         return partitions
 
@@ -169,13 +816,10 @@ if __name__ == "__main__":
         # Upload to cloud storage
         loader = CloudLoader(cloud_config, logger)
         
-        # Upload as CSV
-        csv_path = loader.load(df_final, dataset_name="ecommerce", file_format="csv")
-        print(f"\n✓ Uploaded CSV: {csv_path}")
-        
-        # Upload as JSON
-        json_path = loader.load(df_final, dataset_name="ecommerce", file_format="json")
-        print(f"✓ Uploaded JSON: {json_path}")
+        # Upload as CSV and JSON from a single Arrow conversion
+        paths = loader.load_multi(df_final, dataset_name="ecommerce", formats=["csv", "json"])
+        print(f"\n✓ Uploaded CSV: {paths['csv']}")
+        print(f"✓ Uploaded JSON: {paths['json']}")
         
         # List partitions
         partitions = loader.list_partitions("ecommerce")
@@ -36,6 +36,9 @@ class MySQLLoader:
         self.table_name = config.get('table', 'data_table')
         self.if_exists = config.get('if_exists', 'append')
         self.create_table = config.get('create_table', True)
+        self.chunksize = config.get('chunksize', 10000)
+        self.bulk_load = config.get('bulk_load', False)
+        self.bulk_threshold = config.get('bulk_threshold', 10000)
     
     def load(self, df, table_name=None, if_exists=None):
         """
@@ -58,12 +61,20 @@ class MySQLLoader:
         )
         
         try:
-            # Write to database
-            self.db_connection.write_table(
-                df=df,
-                table_name=table,
-                if_exists=action
-            )
+            # Large frames go through LOAD DATA; small ones aren't worth the temp file
+            if self.bulk_load and len(df) >= self.bulk_threshold:
+                self.db_connection.bulk_load(
+                    df=df,
+                    table_name=table,
+                    if_exists=action
+                )
+            else:
+                self.db_connection.write_table(
+                    df=df,
+                    table_name=table,
+                    if_exists=action,
+                    chunksize=self.chunksize
+                )
             
             rows_loaded = len(df)
             self.logger.info(
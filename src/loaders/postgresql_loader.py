@@ -37,6 +37,9 @@ class PostgreSQLLoader:
         self.schema = config.get('schema', 'public')
         self.if_exists = config.get('if_exists', 'replace')
         self.create_table = config.get('create_table', True)
+        self.chunksize = config.get('chunksize', 10000)
+        self.use_copy = config.get('use_copy', True)
+        self.copy_chunk_size = config.get('copy_chunk_size', 100000)
     
     def load(self, df, table_name=None, schema=None, if_exists=None):
         """
@@ -63,12 +66,16 @@ class PostgreSQLLoader:
         
         try:
             # Write to database
-            self.db_connection.write_table(
-                df=df,
-                table_name=table,
-                schema=schema_name,
-                if_exists=action
-            )
+            if self.use_copy:
+                self._copy_load(df, table, schema_name, action)
+            else:
+                self.db_connection.write_table(
+                    df=df,
+                    table_name=table,
+                    schema=schema_name,
+                    if_exists=action,
+                    chunksize=self.chunksize
+                )
             
             rows_loaded = len(df)
             self.logger.info(
@@ -83,6 +90,24 @@ class PostgreSQLLoader:
             self.logger.error(error_msg)
             raise
     
+    def _copy_load(self, df, table, schema, if_exists):
+        """
+        Load a DataFrame with PostgreSQL COPY instead of INSERT statements.
+        
+        Args:
+            df (pd.DataFrame): Data to load
+            table (str): Table name
+            schema (str): Schema name
+            if_exists (str): Action if table exists ('fail', 'replace', 'append')
+        """
+        self.db_connection.copy_load(
+            df=df,
+            table_name=table,
+            schema=schema,
+            if_exists=if_exists,
+            chunk_size=self.copy_chunk_size
+        )
+    
     def test_connection(self):
         """
         Test the PostgreSQL connection.
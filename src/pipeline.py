@@ -12,19 +12,39 @@ Business Logic:
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add project root to path when run as a script (python src/pipeline.py);
+# importers already have it and shouldn't have sys.path rewritten
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.utils import ConfigLoader, get_logger, PipelineLogger
-from src.extractors.csv_extractor import CSVExtractor
-from src.extractors.api_extractor import APIExtractor
 from src.transformers.data_cleaner import DataCleaner
 from src.transformers.data_merger import DataMerger
 from src.transformers.data_validator import DataValidator
-from src.loaders.csv_loader import CSVLoader
-from src.loaders.cloud_loader import CloudLoader
+
+# Extractors and loaders are imported where they're used, so a run only
+# pays for the HTTP, Arrow and Parquet libraries of enabled endpoints
+
+
+def _clean_worker(args):
+    """
+    Clean one source's DataFrame in a worker process.
+
+    Loggers can't be pickled, so the worker builds its own logger and
+    cleaner from plain configuration dicts.
+
+    Args:
+        args (tuple): (transform_config, log_config, source_name, df)
+
+    Returns:
+        pd.DataFrame: Cleaned data
+    """
+    transform_config, log_config, source_name, df = args
+    logger = get_logger('etl_pipeline', log_config)
+    return DataCleaner(transform_config, logger).clean(df, source_name)
 
 
 class ETLPipeline:
@@ -88,10 +108,7 @@ class ETLPipeline:
         except Exception as e:
             # Log pipeline failure
             self.pipeline_logger.log_pipeline_end(pipeline_name, success=False)
-            self.logger.error(f"Pipeline failed: {e}")
-            
-            import traceback
-            traceback.print_exc()
+            self.logger.exception(f"Pipeline failed: {e}")
             
             return False
     
@@ -109,38 +126,69 @@ class ETLPipeline:
         
         total_records = 0
         
+        # Sources are independent and I/O-bound, so extract them concurrently
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(enabled_sources))) as executor:
+            futures = {
+                executor.submit(self._extract_one, source_name): source_name
+                for source_name in enabled_sources
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Merge in configuration order so downstream merges are deterministic
         for source_name in enabled_sources:
-            try:
-                source_config = self.config_loader.get_source_config(source_name)
-                
-                if source_name == 'csv':
-                    extractor = CSVExtractor(source_config, self.logger)
-                    df = extractor.extract()
-                    self.extracted_data['csv'] = df
-                    total_records += len(df)
-                    
-                elif source_name == 'api':
-                    extractor = APIExtractor(source_config, self.logger)
-                    results = extractor.extract()
-                    
-                    # API returns dict of DataFrames
-                    for endpoint, df in results.items():
-                        if df is not None:
-                            key = f'api_{endpoint}'
-                            self.extracted_data[key] = df
-                            total_records += len(df)
-                
-                # Note: MySQL and PostgreSQL extractors would go here
-                # They're disabled by default until databases are set up
-                
-            except Exception as e:
-                self.logger.error(f"Failed to extract from '{source_name}': {e}")
-                # Continue with other sources
+            for key, df in results[source_name].items():
+                self.extracted_data[key] = df
+                total_records += len(df)
         
         self.pipeline_logger.log_step_end("EXTRACT", total_records)
         
         return self.extracted_data
     
+    def _extract_one(self, source_name):
+        """
+        Extract data from a single source.
+        
+        Failures are logged and yield no data, so one broken source
+        doesn't stop the others.
+        
+        Args:
+            source_name (str): Name of the source in configuration
+            
+        Returns:
+            dict: Extracted DataFrames keyed by dataset name
+        """
+        extracted = {}
+        
+        try:
+            source_config = self.config_loader.get_source_config(source_name)
+            
+            if source_name == 'csv':
+                from src.extractors.csv_extractor import CSVExtractor
+                extractor = CSVExtractor(source_config, self.logger)
+                extracted['csv'] = extractor.extract()
+                
+            elif source_name == 'api':
+                from src.extractors.api_extractor import APIExtractor
+                with APIExtractor(source_config, self.logger) as extractor:
+                    results = extractor.extract()
+                
+                # API returns dict of DataFrames
+                for endpoint, df in results.items():
+                    if df is not None:
+                        extracted[f'api_{endpoint}'] = df
+            
+            # Note: MySQL and PostgreSQL extractors would go here
+            # They're disabled by default until databases are set up
+            
+        except Exception as e:
+            self.logger.error(f"Failed to extract from '{source_name}': {e}")
+            # Continue with other sources
+            return {}
+        
+        return extracted
+    
     def transform(self):
         """
         Transform (clean, validate, standardize) extracted data.
@@ -162,15 +210,12 @@ class ETLPipeline:
         validator = DataValidator(transform_config, self.logger)
         
         # Clean each source
-        cleaned_data = {}
-        for source_name, df in self.extracted_data.items():
-            self.logger.info(f"Cleaning data from '{source_name}'")
-            df_clean = cleaner.clean(df, source_name)
-            cleaned_data[source_name] = df_clean
+        cleaned_data = self._clean_sources(cleaner, transform_config)
         
         # Merge all sources
         self.logger.info("Merging data from all sources")
         merged_data = merger.merge(cleaned_data)
+        del cleaned_data
         
         # Standardize merged data
         self.logger.info("Standardizing data formats")
@@ -190,6 +235,55 @@ class ETLPipeline:
         
         return self.transformed_data
     
+    def _clean_sources(self, cleaner, transform_config):
+        """
+        Clean every extracted source, in parallel when configured.
+        
+        Sources are cleaned one after another unless parallel_processing
+        is enabled. Cleaning is CPU-bound pandas work that holds the GIL,
+        so the 'process' backend cleans sources in separate processes;
+        frames above process_row_limit fall back to threads, because
+        pickling them to and from the workers costs more than the GIL does.
+        
+        Args:
+            cleaner (DataCleaner): Cleaner used for in-process cleaning
+            transform_config (dict): Transform configuration for workers
+            
+        Returns:
+            dict: Cleaned DataFrames keyed by source name, in extraction order
+        """
+        performance = self.config_loader.get('performance', {}) or {}
+        parallel = performance.get('parallel_processing', False)
+        backend = performance.get('parallel_backend', 'none')
+        max_workers = performance.get('max_workers') or os.cpu_count()
+        row_limit = performance.get('process_row_limit', 5000000)
+        
+        source_names = list(self.extracted_data)
+        for source_name in source_names:
+            self.logger.info(f"Cleaning data from '{source_name}'")
+        
+        if not parallel or backend == 'none' or len(source_names) < 2:
+            return {
+                name: cleaner.clean(self.extracted_data[name], name)
+                for name in source_names
+            }
+        
+        sources = [(name, self.extracted_data[name]) for name in source_names]
+        workers = min(max_workers, len(sources))
+        
+        if backend == 'process' and max(len(df) for _, df in sources) <= row_limit:
+            log_config = self.config_loader.get_logging_config()
+            tasks = [(transform_config, log_config, name, df) for name, df in sources]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                cleaned = list(executor.map(_clean_worker, tasks))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                cleaned = list(executor.map(
+                    lambda item: cleaner.clean(item[1], item[0]), sources
+                ))
+        
+        return dict(zip(source_names, cleaned))
+    
     def load(self):
         """
         Load transformed data to all enabled destinations.
@@ -205,49 +299,90 @@ class ETLPipeline:
         enabled_destinations = self.config_loader.get_enabled_destinations()
         self.logger.info(f"Loading to {len(enabled_destinations)} destinations: {enabled_destinations}")
         
-        load_results = {}
+        results = {}
         total_loaded = 0
         
-        for dest_name in enabled_destinations:
-            try:
-                dest_config = self.config_loader.get_destination_config(dest_name)
+        # Destinations are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=max(1, len(enabled_destinations))) as executor:
+            futures = {
+                executor.submit(self._load_one, dest_name): dest_name
+                for dest_name in enabled_destinations
+            }
+            # Reap results as each destination finishes
+            for future in as_completed(futures):
+                dest_name = futures[future]
+                try:
+                    result, records = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to load to '{dest_name}': {e}")
+                    result, records = {'status': 'failed', 'error': str(e)}, 0
+                self.logger.info(f"Destination '{dest_name}' finished: {result['status']}")
+                results[dest_name] = result
+                total_loaded += records
+        
+        load_results = {dest_name: results[dest_name] for dest_name in enabled_destinations}
+        
+        self.pipeline_logger.log_step_end("LOAD", total_loaded)
+        
+        return load_results
+    
+    def _load_one(self, dest_name):
+        """
+        Load transformed data to a single destination.
+        
+        Failures are logged and reported in the result, so one broken
+        destination doesn't stop the others.
+        
+        Args:
+            dest_name (str): Name of the destination in configuration
+            
+        Returns:
+            tuple: (load result dict, number of records written)
+        """
+        try:
+            dest_config = self.config_loader.get_destination_config(dest_name)
+            
+            if dest_name == 'csv_export':
+                from src.loaders.csv_loader import CSVLoader
+                loader = CSVLoader(dest_config, self.logger)
+                output_path = loader.load(self.transformed_data)
+                return {'status': 'success', 'path': output_path}, len(self.transformed_data)
                 
-                if dest_name == 'csv_export':
-                    loader = CSVLoader(dest_config, self.logger)
-                    output_path = loader.load(self.transformed_data)
-                    load_results[dest_name] = {'status': 'success', 'path': output_path}
-                    total_loaded += len(self.transformed_data)
-                    
-                elif dest_name == 'cloud_storage':
-                    loader = CloudLoader(dest_config, self.logger)
-                    # Load as both CSV and JSON
-                    csv_path = loader.load(
+            elif dest_name == 'cloud_storage':
+                from src.loaders.cloud_loader import CloudLoader
+                loader = CloudLoader(dest_config, self.logger)
+                # Load as both CSV and JSON; the two uploads are
+                # independent, so write them concurrently
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    csv_future = executor.submit(
+                        loader.load,
                         self.transformed_data,
                         dataset_name="ecommerce_analytics",
                         file_format="csv"
                     )
-                    json_path = loader.load(
+                    json_future = executor.submit(
+                        loader.load,
                         self.transformed_data,
                         dataset_name="ecommerce_analytics",
                         file_format="json"
                     )
-                    load_results[dest_name] = {
-                        'status': 'success',
-                        'csv_path': csv_path,
-                        'json_path': json_path
-                    }
-                    total_loaded += len(self.transformed_data) * 2  # Count both formats
-                
-                # Note: PostgreSQL and MySQL loaders would go here
-                # They're disabled by default until databases are set up
-                
-            except Exception as e:
-                self.logger.error(f"Failed to load to '{dest_name}': {e}")
-                load_results[dest_name] = {'status': 'failed', 'error': str(e)}
-        
-        self.pipeline_logger.log_step_end("LOAD", total_loaded)
+                    csv_path = csv_future.result()
+                    json_path = json_future.result()
+                result = {
+                    'status': 'success',
+                    'csv_path': csv_path,
+                    'json_path': json_path
+                }
+                return result, len(self.transformed_data) * 2  # Count both formats
+            
+            # Note: PostgreSQL and MySQL loaders would go here
+            # They're disabled by default until databases are set up
+            
+        except Exception as e:
+            self.logger.error(f"Failed to load to '{dest_name}': {e}")
+            return {'status': 'failed', 'error': str(e)}, 0
         
-        return load_results
+        return {'status': 'skipped'}, 0
 
 
 def main():
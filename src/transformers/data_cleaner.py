@@ -10,10 +10,21 @@ Business Logic:
 - Different strategies work for different data types
 """
 
+import logging
+import warnings
+
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, List
 
+from src.utils.dtype_optimizer import find_low_cardinality_columns
+from src.transformers._outlier_kernels import zscore_mask, NUMBA_MIN_CELLS
+
+# Leading non-missing values parsed to decide whether a text column holds dates
+_DATE_PROBE_ROWS = 20
+# Share of values that must parse for a column to be converted
+_CONVERT_RATIO = 0.9
+
 
 class DataCleaner:
     """
@@ -21,6 +32,10 @@ class DataCleaner:
     
     This class handles common data quality issues like missing values,
     duplicates, outliers, and data type inconsistencies.
+    
+    clean() copies its input once; the private _handle_* and
+    _validate_* steps then modify the frame in place, so callers must
+    pass a frame they own.
     """
     
     def __init__(self, config, logger):
@@ -36,6 +51,8 @@ class DataCleaner:
         self.quality_config = config.get('quality_checks', {})
         self.missing_config = config.get('missing_values', {})
         self.outlier_config = config.get('outliers', {})
+        self.category_ratio = config.get('type_conversions', {}).get('category_ratio', 0.5)
+        self.auto_downcast = config.get('type_conversions', {}).get('auto_downcast', True)
     
     def clean(self, df, source_name="unknown"):
         """
@@ -48,39 +65,122 @@ class DataCleaner:
         Returns:
             pd.DataFrame: Cleaned data
         """
-        self.logger.info(f"Starting data cleaning for '{source_name}'")
+        self.logger.info("Starting data cleaning for '%s'", source_name)
         original_rows = len(df)
         
-        # Make a copy to avoid modifying original
+        # Make a copy to avoid modifying original; the steps below
+        # work in place on this copy
         df_clean = df.copy()
         
+        # Repetitive text is held as categories while deduplicating and
+        # filling, so both hash small integer codes instead of strings
+        original_dtypes = self._categorize(df_clean)
+        
+        # Split columns by dtype once; the steps below share the lists
+        numeric_cols = df_clean.select_dtypes(include=[np.number]).columns.tolist()
+        categorical_cols = df_clean.select_dtypes(exclude=[np.number]).columns.tolist()
+        
         # 1. Remove duplicates
         if self.quality_config.get('remove_duplicates', True):
             df_clean = self._remove_duplicates(df_clean)
         
         # 2. Handle missing values
         if self.quality_config.get('handle_missing_values', True):
-            df_clean = self._handle_missing_values(df_clean)
+            df_clean = self._handle_missing_values(df_clean, numeric_cols, categorical_cols)
+            # Refresh after high-missing columns were dropped
+            remaining = set(df_clean.columns)
+            numeric_cols = [col for col in numeric_cols if col in remaining]
+            categorical_cols = [col for col in categorical_cols if col in remaining]
+        
+        # Later stages and the merger expect plain string columns
+        self._restore_dtypes(df_clean, original_dtypes)
         
         # 3. Detect and handle outliers
         if self.quality_config.get('detect_outliers', True):
-            df_clean = self._handle_outliers(df_clean)
+            df_clean = self._handle_outliers(df_clean, numeric_cols)
         
         # 4. Validate and convert data types
         if self.quality_config.get('validate_data_types', True):
-            df_clean = self._validate_data_types(df_clean)
+            df_clean = self._validate_data_types(df_clean, categorical_cols)
+        
+        # 5. Narrow numbers so merge, validation and load move fewer bytes
+        if self.auto_downcast:
+            self._downcast_numeric(df_clean)
         
         # Log summary
         final_rows = len(df_clean)
         rows_removed = original_rows - final_rows
         self.logger.info(
-            f"Cleaning complete for '{source_name}': "
-            f"{original_rows} → {final_rows} rows "
-            f"({rows_removed} removed, {final_rows/original_rows*100:.1f}% retained)"
+            "Cleaning complete for '%s': %s → %s rows (%s removed, %.1f%% retained)",
+            source_name, original_rows, final_rows, rows_removed,
+            final_rows / original_rows * 100
         )
         
         return df_clean
     
+    def _downcast_numeric(self, df):
+        """
+        Downcast numeric columns in place where no value changes.
+        
+        Integers take the smallest integer dtype that holds them. Floats
+        become float32 only if every value survives the round trip
+        exactly, so filled means and capped bounds keep their precision.
+        
+        Args:
+            df (pd.DataFrame): Data to downcast
+        """
+        downcasted = []
+        
+        for col in df.select_dtypes(include=['integer']).columns:
+            narrowed = pd.to_numeric(df[col], downcast='integer')
+            if narrowed.dtype != df[col].dtype:
+                df[col] = narrowed
+                downcasted.append(col)
+        
+        for col in df.select_dtypes(include=['float64']).columns:
+            narrowed = df[col].astype('float32')
+            if narrowed.astype('float64').equals(df[col]):
+                df[col] = narrowed
+                downcasted.append(col)
+        
+        if downcasted:
+            self.logger.debug("Downcast numeric columns: %s", downcasted)
+    
+    def _categorize(self, df):
+        """
+        Convert low-cardinality text columns to 'category' in place.
+        
+        Args:
+            df (pd.DataFrame): Data to convert
+            
+        Returns:
+            dict: Original dtype of each converted column
+        """
+        if not self.category_ratio:
+            return {}
+        
+        original_dtypes = {}
+        for col in find_low_cardinality_columns(df, self.category_ratio):
+            original_dtypes[col] = df[col].dtype
+            df[col] = df[col].astype('category')
+        
+        if original_dtypes:
+            self.logger.debug("Holding %s as categories during cleaning", list(original_dtypes))
+        
+        return original_dtypes
+    
+    def _restore_dtypes(self, df, original_dtypes):
+        """
+        Convert categorized columns back to their original dtype in place.
+        
+        Args:
+            df (pd.DataFrame): Data to convert
+            original_dtypes (dict): Dtypes returned by _categorize
+        """
+        for col, dtype in original_dtypes.items():
+            if col in df.columns:
+                df[col] = df[col].astype(dtype)
+    
     def _remove_duplicates(self, df):
         """
         Remove duplicate rows from DataFrame.
@@ -94,26 +194,67 @@ class DataCleaner:
         initial_count = len(df)
     
         # Convert any unhashable columns (dicts, lists) to strings
-        # This is common with API data that has nested structures
-        df_temp = df.copy()
-        for col in df_temp.columns:
-            # Check if column contains unhashable types
-            if df_temp[col].apply(lambda x: isinstance(x, (dict, list))).any():
-                self.logger.debug(f"Converting column '{col}' with nested data to string for deduplication")
-                df_temp[col] = df_temp[col].astype(str)
-        
-        # Now we can safely drop duplicates
-        df_clean = df_temp.drop_duplicates()
+        # This is common with API data that has nested structures.
+        # Only object columns can hold them, and a few non-null cells
+        # are enough to tell a nested column apart
+        object_cols = df.select_dtypes(include=['object']).columns
+        nested_cols = self._find_nested_columns(df, object_cols)
+        
+        try:
+            df_clean = self._stringify(df, nested_cols).drop_duplicates()
+        except TypeError:
+            # Nested values the sample missed; check every object cell
+            nested_cols = self._find_nested_columns(df, object_cols, sample_size=None)
+            df_clean = self._stringify(df, nested_cols).drop_duplicates()
+        
         duplicates_removed = initial_count - len(df_clean)
         
         if duplicates_removed > 0:
-            self.logger.info(f"Removed {duplicates_removed} duplicate rows")
+            self.logger.info("Removed %s duplicate rows", duplicates_removed)
         else:
             self.logger.info("No duplicate rows found")
         
         return df_clean
     
-    def _handle_missing_values(self, df):
+    def _find_nested_columns(self, df, columns, sample_size=20):
+        """
+        Find columns holding dicts or lists.
+        
+        Args:
+            df (pd.DataFrame): Input data
+            columns (list): Columns to check
+            sample_size (int): Non-null values to inspect per column (None checks all)
+            
+        Returns:
+            list: Names of columns with nested values
+        """
+        nested_cols = []
+        for col in columns:
+            values = df[col].dropna()
+            if sample_size is not None:
+                values = values.head(sample_size)
+            if any(isinstance(v, (dict, list)) for v in values):
+                nested_cols.append(col)
+        return nested_cols
+    
+    def _stringify(self, df, columns):
+        """
+        Convert the given columns to strings, leaving the rest untouched.
+        
+        Args:
+            df (pd.DataFrame): Input data
+            columns (list): Columns to convert
+            
+        Returns:
+            pd.DataFrame: Data with the columns as strings
+        """
+        for col in columns:
+            self.logger.debug("Converting column '%s' with nested data to string for deduplication", col)
+        if not columns:
+            return df
+        return df.assign(**{col: df[col].astype(str) for col in columns})
+    
+    def _handle_missing_values(self, df, numeric_cols=None, categorical_cols=None):
         """
         Handle missing values in DataFrame.
         
@@ -124,11 +265,17 @@ class DataCleaner:
         
         Args:
             df (pd.DataFrame): Input data
+            numeric_cols (list): Numeric columns (detected if None)
+            categorical_cols (list): Non-numeric columns (detected if None)
             
         Returns:
             pd.DataFrame: Data with missing values handled
         """
-        df_clean = df.copy()
+        df_clean = df
+        
+        # Count missing values once; the checks below reuse the counts
+        null_counts = df_clean.isnull().sum()
+        missing_before = null_counts.sum()
         
         # Get strategies from config
         numeric_strategy = self.missing_config.get('numeric_strategy', 'mean')
@@ -136,66 +283,97 @@ class DataCleaner:
         threshold = self.missing_config.get('threshold', 0.5)
         
         # Identify numeric and categorical columns
-        numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
-        categorical_cols = df_clean.select_dtypes(exclude=[np.number]).columns
+        if numeric_cols is None:
+            numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
+        if categorical_cols is None:
+            categorical_cols = df_clean.select_dtypes(exclude=[np.number]).columns
         
         # Check for columns with too many missing values
-        missing_pct = df_clean.isnull().sum() / len(df_clean)
+        missing_pct = null_counts / len(df_clean)
         cols_to_drop = missing_pct[missing_pct > threshold].index.tolist()
         
         if cols_to_drop:
             self.logger.warning(
-                f"Dropping columns with >{threshold*100}% missing: {cols_to_drop}"
+                "Dropping columns with >%s%% missing: %s", threshold * 100, cols_to_drop
             )
             df_clean = df_clean.drop(columns=cols_to_drop)
             # Update column lists
             numeric_cols = [col for col in numeric_cols if col not in cols_to_drop]
             categorical_cols = [col for col in categorical_cols if col not in cols_to_drop]
         
+        # Collect fill values for every column first, then fill in one pass
+        fill_values = {}
+        
         # Handle numeric columns
-        for col in numeric_cols:
-            missing_count = df_clean[col].isnull().sum()
-            if missing_count > 0:
-                if numeric_strategy == 'mean':
-                    fill_value = df_clean[col].mean()
-                    df_clean[col].fillna(fill_value, inplace=True)
-                    self.logger.debug(f"Filled {missing_count} missing values in '{col}' with mean: {fill_value:.2f}")
-                elif numeric_strategy == 'median':
-                    fill_value = df_clean[col].median()
-                    df_clean[col].fillna(fill_value, inplace=True)
-                    self.logger.debug(f"Filled {missing_count} missing values in '{col}' with median: {fill_value:.2f}")
-                elif numeric_strategy == 'zero':
-                    df_clean[col].fillna(0, inplace=True)
-                    self.logger.debug(f"Filled {missing_count} missing values in '{col}' with 0")
-                elif numeric_strategy == 'drop':
-                    df_clean = df_clean.dropna(subset=[col])
-                    self.logger.debug(f"Dropped {missing_count} rows with missing values in '{col}'")
+        numeric_missing = [col for col in numeric_cols if null_counts[col] > 0]
+        if numeric_missing:
+            if numeric_strategy in ('mean', 'median'):
+                numeric_fills = df_clean[numeric_missing].agg(numeric_strategy)
+                fill_values.update(numeric_fills.to_dict())
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Filling %s with %s: %s", numeric_missing, numeric_strategy, numeric_fills.round(2).to_dict())
+            elif numeric_strategy == 'zero':
+                fill_values.update(dict.fromkeys(numeric_missing, 0))
+                self.logger.debug("Filling %s with 0", numeric_missing)
+            elif numeric_strategy == 'drop':
+                df_clean = df_clean.dropna(subset=numeric_missing)
+                # Dropped rows may have held categorical gaps too
+                null_counts = df_clean[list(categorical_cols)].isnull().sum()
+                self.logger.debug("Dropped rows with missing values in %s", numeric_missing)
         
         # Handle categorical columns
-        for col in categorical_cols:
-            missing_count = df_clean[col].isnull().sum()
-            if missing_count > 0:
-                if categorical_strategy == 'mode':
-                    if not df_clean[col].mode().empty:
-                        fill_value = df_clean[col].mode()[0]
-                        df_clean[col].fillna(fill_value, inplace=True)
-                        self.logger.debug(f"Filled {missing_count} missing values in '{col}' with mode: {fill_value}")
-                    else:
-                        df_clean[col].fillna('Unknown', inplace=True)
-                        self.logger.debug(f"Filled {missing_count} missing values in '{col}' with 'Unknown'")
-                elif categorical_strategy == 'unknown':
-                    df_clean[col].fillna('Unknown', inplace=True)
-                    self.logger.debug(f"Filled {missing_count} missing values in '{col}' with 'Unknown'")
-                elif categorical_strategy == 'drop':
-                    df_clean = df_clean.dropna(subset=[col])
-                    self.logger.debug(f"Dropped {missing_count} rows with missing values in '{col}'")
-        
-        total_filled = df.isnull().sum().sum() - df_clean.isnull().sum().sum()
-        self.logger.info(f"Handled {total_filled} missing values")
+        categorical_missing = [col for col in categorical_cols if null_counts[col] > 0]
+        if categorical_missing:
+            if categorical_strategy == 'mode':
+                cat_fills = {col: self._most_frequent(df_clean[col]) for col in categorical_missing}
+                fill_values.update(cat_fills)
+                self.logger.debug("Filling %s with mode: %s", categorical_missing, cat_fills)
+            elif categorical_strategy == 'unknown':
+                fill_values.update(dict.fromkeys(categorical_missing, 'Unknown'))
+                self.logger.debug("Filling %s with 'Unknown'", categorical_missing)
+            elif categorical_strategy == 'drop':
+                df_clean = df_clean.dropna(subset=categorical_missing)
+                self.logger.debug("Dropped rows with missing values in %s", categorical_missing)
+        
+        if fill_values:
+            # Categorical columns only accept fill values from their categories
+            for col, value in fill_values.items():
+                if isinstance(df_clean[col].dtype, pd.CategoricalDtype) and value not in df_clean[col].cat.categories:
+                    df_clean[col] = df_clean[col].cat.add_categories([value])
+            df_clean.fillna(fill_values, inplace=True)
+        
+        total_filled = missing_before - df_clean.isnull().sum().sum()
+        self.logger.info("Handled %s missing values", total_filled)
         
         return df_clean
     
-    def _handle_outliers(self, df):
+    def _most_frequent(self, series):
+        """
+        Get the most frequent non-null value of a column.
+        
+        Uses value_counts, which hashes once and skips the full sort that
+        mode() does; on categoricals it just counts integer codes. Ties go
+        to the smallest value, as with mode().
+        
+        Args:
+            series (pd.Series): Column to inspect
+            
+        Returns:
+            Any: Most frequent value, or 'Unknown' if the column is empty
+        """
+        counts = series.value_counts(dropna=True)
+        if counts.empty or counts.iloc[0] == 0:
+            return 'Unknown'
+        
+        tied = counts.index[counts.to_numpy() == counts.iloc[0]]
+        if len(tied) == 1:
+            return tied[0]
+        try:
+            return sorted(tied)[0]
+        except TypeError:  # Mixed types can't be ordered
+            return tied[0]
+    
+    def _handle_outliers(self, df, numeric_cols=None):
         """
         Detect and handle outliers in numeric columns.
         
@@ -207,72 +385,127 @@ class DataCleaner:
         
         Args:
             df (pd.DataFrame): Input data
+            numeric_cols (list): Numeric columns (detected if None)
             
         Returns:
             pd.DataFrame: Data with outliers handled
         """
-        df_clean = df.copy()
+        df_clean = df
         
         method = self.outlier_config.get('method', 'iqr')
         threshold = self.outlier_config.get('threshold', 1.5)
         action = self.outlier_config.get('action', 'cap')
         
-        numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
+        if numeric_cols is None:
+            numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
         
-        outlier_count = 0
+        if len(numeric_cols) == 0:
+            self.logger.info("No outliers detected")
+            return df_clean
         
-        for col in numeric_cols:
-            if method == 'iqr':
-                # IQR method
-                Q1 = df_clean[col].quantile(0.25)
-                Q3 = df_clean[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - threshold * IQR
-                upper_bound = Q3 + threshold * IQR
-                
-                outliers = (df_clean[col] < lower_bound) | (df_clean[col] > upper_bound)
+        if method not in ('iqr', 'zscore'):
+            self.logger.warning("Unknown outlier method: %s", method)
+            return df_clean
+        
+        # Detection runs on one 2D float array: statistics per column
+        # (axis=0) and a broadcast comparison against them
+        numeric_cols = list(numeric_cols)
+        arr = df_clean[numeric_cols].to_numpy(dtype='float64', na_value=np.nan)
+        mask, lower_bound, upper_bound = self._outlier_mask(arr, method, threshold)
+        
+        col_outliers = pd.Series(mask.sum(axis=0), index=numeric_cols)
+        hit = col_outliers.to_numpy() > 0
+        outlier_cols = col_outliers[hit].index.tolist()
+        outlier_count = int(col_outliers.sum())
+        
+        if outlier_cols:
+            if action == 'cap':
+                # Cap values to bounds; pandas clip keeps integer columns integer
+                if method == 'iqr':
+                    df_clean[outlier_cols] = df_clean[outlier_cols].clip(
+                        lower=pd.Series(lower_bound[hit], index=outlier_cols),
+                        upper=pd.Series(upper_bound[hit], index=outlier_cols),
+                        axis=1
+                    )
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Capped outliers in %s: %s", outlier_cols, col_outliers[outlier_cols].to_dict())
                 
-            elif method == 'zscore':
-                # Z-score method
-                mean = df_clean[col].mean()
-                std = df_clean[col].std()
-                z_scores = np.abs((df_clean[col] - mean) / std)
-                outliers = z_scores > threshold
+            elif action == 'remove':
+                # Columns are screened in order, each on the rows the earlier
+                # columns kept, so later bounds come from the surviving rows
+                keep = np.ones(len(arr), dtype=bool)
+                for i in range(len(numeric_cols)):
+                    if not keep.all():
+                        col_mask = np.zeros(len(arr), dtype=bool)
+                        col_mask[keep] = self._outlier_mask(arr[keep, i:i + 1], method, threshold)[0][:, 0]
+                        mask[:, i] = col_mask
+                    keep &= ~mask[:, i]
+                col_outliers = pd.Series(mask.sum(axis=0), index=numeric_cols)
+                outlier_cols = col_outliers[col_outliers > 0].index.tolist()
+                outlier_count = int(col_outliers.sum())
+                df_clean = df_clean[keep]
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Removed outlier rows in %s: %s", outlier_cols, col_outliers[outlier_cols].to_dict())
             
-            else:
-                self.logger.warning(f"Unknown outlier method: {method}")
-                continue
-            
-            col_outliers = outliers.sum()
-            if col_outliers > 0:
-                outlier_count += col_outliers
-                
-                if action == 'cap':
-                    # Cap values to bounds
-                    if method == 'iqr':
-                        df_clean.loc[df_clean[col] < lower_bound, col] = lower_bound
-                        df_clean.loc[df_clean[col] > upper_bound, col] = upper_bound
-                        self.logger.debug(f"Capped {col_outliers} outliers in '{col}' to [{lower_bound:.2f}, {upper_bound:.2f}]")
-                    
-                elif action == 'remove':
-                    # Remove rows with outliers
-                    df_clean = df_clean[~outliers]
-                    self.logger.debug(f"Removed {col_outliers} outlier rows in '{col}'")
-                
-                elif action == 'flag':
-                    # Add a flag column
-                    flag_col = f'{col}_outlier_flag'
-                    df_clean[flag_col] = outliers
-                    self.logger.debug(f"Flagged {col_outliers} outliers in '{col}'")
+            elif action == 'flag':
+                # Add all flag columns in one concat
+                flags = pd.DataFrame(
+                    mask[:, hit],
+                    columns=[f'{col}_outlier_flag' for col in outlier_cols],
+                    index=df_clean.index
+                )
+                df_clean = pd.concat([df_clean.drop(columns=flags.columns, errors='ignore'), flags], axis=1)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Flagged outliers in %s: %s", outlier_cols, col_outliers[outlier_cols].to_dict())
         
         if outlier_count > 0:
-            self.logger.info(f"Handled {outlier_count} outliers using '{method}' method with action '{action}'")
+            self.logger.info("Handled %s outliers using '%s' method with action '%s'", outlier_count, method, action)
         else:
             self.logger.info("No outliers detected")
         
         return df_clean
     
-    def _validate_data_types(self, df):
+    def _outlier_mask(self, arr, method, threshold):
+        """
+        Flag outliers in each column of a 2D float array.
+        
+        Args:
+            arr (np.ndarray): Values, one column per numeric column
+            method (str): 'iqr' or 'zscore'
+            threshold (float): IQR multiplier or z-score limit
+            
+        Returns:
+            tuple: (boolean outlier mask, lower bounds, upper bounds); the
+                   bounds are None for the z-score method
+        """
+        lower_bound = upper_bound = None
+        
+        # All-NaN columns yield NaN statistics and never match
+        with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+            warnings.simplefilter('ignore', RuntimeWarning)
+            
+            if method == 'iqr':
+                # IQR method
+                Q1, Q3 = np.nanquantile(arr, [0.25, 0.75], axis=0)
+                IQR = Q3 - Q1
+                lower_bound = Q1 - threshold * IQR
+                upper_bound = Q3 + threshold * IQR
+                
+                mask = (arr < lower_bound) | (arr > upper_bound)
+                
+            else:
+                # Z-score method
+                mean = np.nanmean(arr, axis=0)
+                std = np.nanstd(arr, axis=0, ddof=1)
+                if zscore_mask is not None and arr.size > NUMBA_MIN_CELLS:
+                    # Fused single pass over large blocks (requires numba)
+                    mask = zscore_mask(arr, mean, std, float(threshold))
+                else:
+                    mask = np.abs((arr - mean) / std) > threshold
+        
+        return mask, lower_bound, upper_bound
+    
+    def _validate_data_types(self, df, columns=None):
         """
         Validate and convert data types.
         
@@ -283,33 +516,47 @@ class DataCleaner:
         
         Args:
             df (pd.DataFrame): Input data
+            columns (list): Non-numeric columns to check (all columns if None)
             
         Returns:
             pd.DataFrame: Data with corrected types
         """
-        df_clean = df.copy()
+        df_clean = df
         
         if not self.config.get('type_conversions', {}).get('auto_detect', True):
             return df_clean
         
         conversions_made = 0
         
-        for col in df_clean.columns:
+        if columns is None:
+            columns = df_clean.columns
+        
+        if len(df_clean) == 0:
+            return df_clean
+        
+        for col in columns:
             # Skip if already numeric
             if pd.api.types.is_numeric_dtype(df_clean[col]):
                 continue
             
             # Try to convert to datetime
-            if df_clean[col].dtype == 'object':
-                # Check if column looks like dates
+            dtype = df_clean[col].dtype
+            if pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.StringDtype):
                 try:
-                    # Try parsing as dates
-                    sample = df_clean[col].dropna().head(10)
-                    if len(sample) > 0:
-                        pd.to_datetime(sample, errors='raise')
-                        # If successful, convert whole column
-                        df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
-                        self.logger.debug(f"Converted '{col}' to datetime")
+                    # Names, emails etc. fail a short probe cheaply; only
+                    # date-like columns get the full per-value parse
+                    sample = df_clean[col].dropna().head(_DATE_PROBE_ROWS)
+                    probe = pd.to_datetime(sample, errors='coerce', format='mixed')
+                    if len(sample) == 0 or probe.notna().mean() < _CONVERT_RATIO:
+                        raise ValueError("not a date column")
+                    
+                    # Parse the whole column once; cache=True parses each
+                    # distinct string only once
+                    converted = pd.to_datetime(df_clean[col], errors='coerce', format='mixed', cache=True)
+                    # Only convert if most values are dates
+                    if converted.notna().sum() / len(df_clean) > _CONVERT_RATIO:
+                        df_clean[col] = converted
+                        self.logger.debug("Converted '%s' to datetime", col)
                         conversions_made += 1
                         continue
                 except:
@@ -319,15 +566,15 @@ class DataCleaner:
                 try:
                     converted = pd.to_numeric(df_clean[col], errors='coerce')
                     # Only convert if we don't lose too much data
-                    if converted.notna().sum() / len(df_clean) > 0.9:
+                    if converted.notna().sum() / len(df_clean) > _CONVERT_RATIO:
                         df_clean[col] = converted
-                        self.logger.debug(f"Converted '{col}' to numeric")
+                        self.logger.debug("Converted '%s' to numeric", col)
                         conversions_made += 1
                 except:
                     pass
         
         if conversions_made > 0:
-            self.logger.info(f"Converted {conversions_made} columns to appropriate data types")
+            self.logger.info("Converted %s columns to appropriate data types", conversions_made)
         
         return df_clean
 
@@ -10,10 +10,66 @@ Business Logic:
 - Clean, merged data is ready for analysis and loading
 """
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# Any run of whitespace (tabs, newlines, repeated spaces) becomes one space
+_WS_RE = re.compile(r'\s+')
+# RE2 spelling of the same set (Python's str.isspace) for pyarrow.compute
+_WS_RE2 = r'[\t-\r\x1c-\x1f\x85\p{Z}]+'
+# 'order' in any case becomes the ORD- prefix
+_ORDER_RE = re.compile('order', re.IGNORECASE)
+
+# Common status abbreviations/typos and their standard codes
+_STATUS_MAPPING = {
+    'SHIPPD': 'SHIPPED',
+    'DELIVERD': 'DELIVERED',
+    'CNCLLD': 'CANCELLED',
+    'COMPLETE': 'COMPLETED',
+    'PNDNG': 'PENDING',
+    'PROCESSING': 'PENDING'
+}
+
+# Text columns with at most this share of distinct values are transformed
+# once per distinct value instead of once per row
+_UNIQUE_RATIO = 0.5
+
+
+def _is_ascii(arr):
+    """
+    Check whether a pyarrow string array holds only ASCII text.
+    
+    Reads the value bytes straight from the Arrow data buffer with one
+    NumPy max(), far cheaper than a per-string check.
+    
+    Args:
+        arr (pa.Array): Array of type pa.string()
+        
+    Returns:
+        bool: True if no byte is 0x80 or above
+    """
+    chunks = arr.chunks if isinstance(arr, pa.ChunkedArray) else [arr]
+    for chunk in chunks:
+        offsets_buf, data_buf = chunk.buffers()[1:3]
+        if len(chunk) == 0 or data_buf is None:
+            continue
+        offsets = np.frombuffer(offsets_buf, dtype=np.int32)
+        start, end = offsets[chunk.offset], offsets[chunk.offset + len(chunk)]
+        if end > start and np.frombuffer(data_buf, dtype=np.uint8)[start:end].max() >= 0x80:
+            return False
+    return True
+
 
 class DataMerger:
     """
@@ -51,30 +107,70 @@ class DataMerger:
         if len(dataframes_dict) == 1:
             # Only one source, return it standardized
             source_name, df = list(dataframes_dict.items())[0]
-            self.logger.info(f"Single data source '{source_name}', applying standardization")
+            self.logger.info("Single data source '%s', applying standardization", source_name)
             return self.standardize(df)
         
-        self.logger.info(f"Merging {len(dataframes_dict)} data sources")
-        
-        # Start with first DataFrame
-        merged_df = None
+        self.logger.info("Merging %s data sources", len(dataframes_dict))
         
         for source_name, df in dataframes_dict.items():
-            self.logger.info(f"Processing source '{source_name}': {len(df)} rows")
-            
-            if merged_df is None:
-                merged_df = df.copy()
-            else:
-                # Concatenate vertically (stack DataFrames)
-                merged_df = pd.concat([merged_df, df], ignore_index=True, sort=False)
+            self.logger.info("Processing source '%s': %s rows", source_name, len(df))
+        
+        # Concatenate vertically (stack DataFrames) in one pass, rather
+        # than re-copying the growing result for every source
+        frames = list(dataframes_dict.values())
+        merged_df = self._stack_same_schema(frames)
+        if merged_df is None:
+            merged_df = pd.concat(frames, ignore_index=True, sort=False)
         
-        self.logger.info(f"Merge complete: {len(merged_df)} total rows")
+        self.logger.info("Merge complete: %s total rows", len(merged_df))
         
         # Apply standardization to merged data
         merged_df = self.standardize(merged_df)
         
         return merged_df
     
+    def _stack_same_schema(self, frames):
+        """
+        Stack frames that share one schema into pre-allocated columns.
+        
+        Each column is allocated once at the full length and every source
+        is copied straight into its slice, skipping concat's alignment and
+        dtype reconciliation. Only used when all frames have the same
+        columns with the same NumPy dtypes, so the result matches concat.
+        
+        Args:
+            frames (list): DataFrames to stack
+            
+        Returns:
+            pd.DataFrame: Stacked data, or None if the schemas differ
+        """
+        first = frames[0]
+        if not first.columns.is_unique:
+            return None
+        
+        for df in frames:
+            if not df.columns.equals(first.columns):
+                return None
+            if not df.dtypes.equals(first.dtypes):
+                return None
+        
+        # Extension dtypes (categories, nullable ints, Arrow strings) go through concat
+        if not all(isinstance(dtype, np.dtype) for dtype in first.dtypes):
+            return None
+        
+        total_rows = sum(len(df) for df in frames)
+        columns = {}
+        for col, dtype in first.dtypes.items():
+            arr = np.empty(total_rows, dtype=dtype)
+            offset = 0
+            for df in frames:
+                arr[offset:offset + len(df)] = df[col].to_numpy(copy=False)
+                offset += len(df)
+            # Explicit dtype stops pandas re-inferring object columns as strings
+            columns[col] = pd.Series(arr, dtype=dtype, copy=False)
+        
+        return pd.DataFrame(columns, columns=first.columns, copy=False)
+    
     def standardize(self, df):
         """
         Standardize data formats for consistency.
@@ -86,6 +182,7 @@ class DataMerger:
         - Email should be lowercase
         - Remove extra whitespace
         - Fix negative quantities
+        - Store low-cardinality codes (status) as categories if configured
         
         Args:
             df (pd.DataFrame): Data to standardize
@@ -94,84 +191,351 @@ class DataMerger:
             pd.DataFrame: Standardized data
         """
         self.logger.info("Applying format standardization")
-        df_std = df.copy()
-        
-        # 1. Standardize customer names (Title Case)
-        if 'customer_name' in df_std.columns:
-            df_std['customer_name'] = df_std['customer_name'].str.strip().str.title()
-            self.logger.debug("Standardized customer names to Title Case")
-        
-        # 2. Standardize order IDs (uppercase, consistent format)
-        if 'order_id' in df_std.columns:
-            # Remove special characters like #, then add ORD- prefix if missing
-            df_std['order_id'] = df_std['order_id'].astype(str).str.strip()
-            df_std['order_id'] = df_std['order_id'].str.replace('#', '', regex=False)
-            df_std['order_id'] = df_std['order_id'].str.replace('order', 'ORD-', regex=False, flags=2)
-            df_std['order_id'] = df_std['order_id'].str.upper()
-            
-            # Ensure all have ORD- prefix
-            mask = ~df_std['order_id'].str.startswith('ORD-')
-            df_std.loc[mask, 'order_id'] = 'ORD-' + df_std.loc[mask, 'order_id']
-            
-            self.logger.debug("Standardized order IDs to ORD-XXXX format")
-        
-        # 3. Standardize email (lowercase, trim)
-        if 'email' in df_std.columns:
-            df_std['email'] = df_std['email'].str.strip().str.lower()
-            self.logger.debug("Standardized emails to lowercase")
-        
-        # 4. Standardize status codes (uppercase, consistent abbreviations)
-        if 'status' in df_std.columns:
-            df_std['status'] = df_std['status'].str.strip().str.upper()
-            
-            # Fix common abbreviations/typos
-            status_mapping = {
-                'SHIPPD': 'SHIPPED',
-                'DELIVERD': 'DELIVERED',
-                'CNCLLD': 'CANCELLED',
-                'COMPLETE': 'COMPLETED',
-                'PNDNG': 'PENDING',
-                'PROCESSING': 'PENDING'
-            }
-            df_std['status'] = df_std['status'].replace(status_mapping)
-            self.logger.debug("Standardized status codes")
-        
-        # 5. Standardize category names (Title Case)
-        if 'category' in df_std.columns:
-            df_std['category'] = df_std['category'].str.strip().str.title()
-            self.logger.debug("Standardized category names to Title Case")
-        
-        # 6. Standardize product names (Title Case)
-        if 'product_name' in df_std.columns:
-            df_std['product_name'] = df_std['product_name'].str.strip().str.title()
-            self.logger.debug("Standardized product names to Title Case")
+        # Shallow copy: every step below assigns whole new columns, so
+        # untouched columns keep sharing memory with the input
+        df_std = df.copy(deep=False)
+        
+        # 1-6. Per-column text rules; each touches only its own column
+        text_rules = {
+            # 1. Customer names: Title Case
+            'customer_name': (
+                lambda s: self._strip_case(s, 'title'),
+                "Standardized customer names to Title Case"
+            ),
+            # 2. Order IDs: remove special characters like #, uppercase,
+            # add ORD- prefix if missing
+            'order_id': (
+                lambda s: self._normalize_order_ids(s.astype(str)),
+                "Standardized order IDs to ORD-XXXX format"
+            ),
+            # 3. Email: lowercase, trim
+            'email': (
+                lambda s: self._strip_case(s, 'lower'),
+                "Standardized emails to lowercase"
+            ),
+            # 4. Status codes: uppercase, fix common abbreviations/typos
+            'status': (
+                lambda s: self._map_distinct(
+                    s, lambda v: self._strip_case(v, 'upper').replace(_STATUS_MAPPING)
+                ),
+                "Standardized status codes"
+            ),
+            # 5. Category names: Title Case
+            'category': (
+                lambda s: self._map_distinct(s, lambda v: self._strip_case(v, 'title')),
+                "Standardized category names to Title Case"
+            ),
+            # 6. Product names: Title Case
+            'product_name': (
+                lambda s: self._map_distinct(s, lambda v: self._strip_case(v, 'title')),
+                "Standardized product names to Title Case"
+            ),
+        }
+        rules = {col: rule for col, (rule, _) in text_rules.items() if col in df_std.columns}
+        for col, values in self._apply_by_column(df_std, rules).items():
+            df_std[col] = values
+        for col, (_, message) in text_rules.items():
+            if col in rules:
+                self.logger.debug(message)
         
         # 7. Fix negative quantities (make absolute)
         if 'quantity' in df_std.columns:
-            negative_count = (df_std['quantity'] < 0).sum()
+            # A min() reduction rules out the usual all-positive column
+            # without allocating a boolean mask
+            quantity_min = df_std['quantity'].min()
+            has_negative = pd.notna(quantity_min) and quantity_min < 0
+            negative_count = (df_std['quantity'] < 0).sum() if has_negative else 0
             if negative_count > 0:
                 df_std['quantity'] = df_std['quantity'].abs()
-                self.logger.info(f"Fixed {negative_count} negative quantities by taking absolute value")
+                self.logger.info("Fixed %s negative quantities by taking absolute value", negative_count)
         
         # 8. Clean price column (remove $ signs, convert to float)
         if 'price' in df_std.columns:
             if df_std['price'].dtype == 'object':
-                df_std['price'] = df_std['price'].astype(str).str.replace('$', '', regex=False)
-                df_std['price'] = df_std['price'].str.replace(',', '', regex=False)
-                df_std['price'] = pd.to_numeric(df_std['price'], errors='coerce')
+                df_std['price'] = self._parse_prices(df_std['price'])
                 self.logger.debug("Converted price to numeric format")
+            
+            # Optionally hold prices as exact integer cents
+            price_cents = self.config.get('type_conversions', {}).get('price_cents', False)
+            if price_cents and pd.api.types.is_float_dtype(df_std['price']):
+                df_std['price'] = self._to_cents(df_std['price'])
+                df_std = df_std.rename(columns={'price': 'price_cents'})
+                self.logger.debug("Converted price to integer cents (price_cents)")
         
         # 9. Remove tabs and extra whitespace from all string columns
         string_cols = df_std.select_dtypes(include=['object']).columns
-        for col in string_cols:
-            df_std[col] = df_std[col].astype(str).str.replace('\t', ' ', regex=False)
-            df_std[col] = df_std[col].str.replace(r'\s+', ' ', regex=True)
-            df_std[col] = df_std[col].str.strip()
+        collapse = lambda s: self._collapse_whitespace(s.astype(str))
+        for col, values in self._apply_by_column(df_std, dict.fromkeys(string_cols, collapse)).items():
+            df_std[col] = values
+        
+        # 10. Store configured low-cardinality columns (e.g. status) as
+        # categories: one small integer code per row instead of a string
+        low_cardinality = self.config.get('type_conversions', {}).get('low_cardinality_cols', [])
+        for col in low_cardinality:
+            if col in df_std.columns:
+                df_std[col] = df_std[col].astype('category')
         
         self.logger.info("Format standardization complete")
         
         return df_std
     
+    def _apply_by_column(self, df, rules):
+        """
+        Apply a function to each of several columns.
+        
+        Columns are independent of each other, and most of the work runs
+        in pyarrow.compute kernels that release the GIL, so frames with
+        at least type_conversions.parallel_column_rows rows are processed
+        one column per thread.
+        
+        Args:
+            df (pd.DataFrame): Data being standardized
+            rules (dict): Column name -> function taking and returning a pd.Series
+            
+        Returns:
+            dict: Column name -> transformed pd.Series
+        """
+        apply = lambda col: rules[col](df[col])
+        
+        min_rows = self.config.get('type_conversions', {}).get('parallel_column_rows', 1000000)
+        if not min_rows or len(df) < min_rows or len(rules) < 2:
+            return {col: apply(col) for col in rules}
+        
+        workers = min(len(rules), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(rules, executor.map(apply, rules)))
+    
+    def _normalize_order_ids(self, ids):
+        """
+        Normalize order IDs to the ORD-XXXX format.
+        
+        Strips whitespace, drops '#', turns 'order' (any case) into 'ORD-',
+        uppercases, and adds the ORD- prefix where it's still missing.
+        Text columns run the steps as pyarrow.compute kernels over the
+        whole array rather than a Python string method per value.
+        
+        Args:
+            ids (pd.Series): Order IDs as strings
+            
+        Returns:
+            pd.Series: Normalized order IDs
+        """
+        arr = self._string_array(ids)
+        if arr is not None:
+            source = arr
+            arr = pc.utf8_trim_whitespace(arr)
+            arr = pc.replace_substring(arr, '#', '')
+            arr = pc.replace_substring_regex(arr, '(?i)' + _ORDER_RE.pattern, 'ORD-')
+            arr = pc.ascii_upper(arr) if _is_ascii(arr) else pc.utf8_upper(arr)
+            arr = pc.if_else(
+                pc.starts_with(arr, 'ORD-'),
+                arr,
+                pc.binary_join_element_wise('ORD-', arr, '')
+            )
+            return self._from_arrow(arr, source, ids)
+        
+        ids = ids.str.strip()
+        ids = ids.str.replace('#', '', regex=False)
+        ids = ids.str.replace(_ORDER_RE, 'ORD-', regex=True)
+        ids = ids.str.upper()
+        
+        # Ensure all have ORD- prefix
+        mask = ~ids.str.startswith('ORD-')
+        ids.loc[mask] = 'ORD-' + ids.loc[mask]
+        return ids
+    
+    def _collapse_whitespace(self, values):
+        """
+        Collapse runs of whitespace to one space and trim both ends.
+        
+        Text columns go through pyarrow.compute (one regex kernel over
+        the whole buffer) when pyarrow is installed. Otherwise object
+        columns take one compiled-regex pass per value and other string
+        columns use the .str accessor.
+        
+        Args:
+            values (pd.Series): Column of strings
+            
+        Returns:
+            pd.Series: Cleaned column with the same index
+        """
+        arr = self._string_array(values)
+        if arr is not None:
+            if values.dtype == object:
+                # After collapsing, the only whitespace left at the ends is ' '
+                result = pc.utf8_trim(pc.replace_substring_regex(arr, _WS_RE2, ' '), ' ')
+            else:
+                # Same kernels .str.replace/.str.strip run on str columns
+                result = pc.utf8_trim_whitespace(pc.replace_substring_regex(arr, _WS_RE.pattern, ' '))
+            return self._from_arrow(result, arr, values)
+        
+        if values.dtype != object:
+            return values.str.replace(_WS_RE.pattern, ' ', regex=True).str.strip()
+        
+        # One pass per value with the compiled pattern, bypassing
+        # the .str accessor's per-call overhead
+        return pd.Series(
+            [_WS_RE.sub(' ', value).strip() for value in values.to_numpy()],
+            index=values.index,
+            dtype=object,
+            name=values.name
+        )
+    
+    def _parse_prices(self, prices):
+        """
+        Convert price text such as '$1,299.00' to numbers.
+        
+        '$' and ',' are removed in one regex pass (a pyarrow.compute kernel
+        when available) before a single to_numeric call; values that still
+        aren't numbers become NaN.
+        
+        Args:
+            prices (pd.Series): Price column with object dtype
+            
+        Returns:
+            pd.Series: Numeric prices with the same index
+        """
+        text = prices.astype(str)
+        cleaned = None
+        if pa is not None:
+            try:
+                arr = pa.array(text, type=pa.string(), from_pandas=True)
+                cleaned = pc.replace_substring_regex(arr, '[$,]', '').to_numpy(zero_copy_only=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                cleaned = None
+        
+        if cleaned is None:
+            cleaned = text.str.replace('[$,]', '', regex=True)
+        else:
+            cleaned = pd.Series(cleaned, index=prices.index, dtype=object, name=prices.name)
+        
+        return pd.to_numeric(cleaned, errors='coerce')
+    
+    def _to_cents(self, prices):
+        """
+        Convert float prices in dollars to integer cents.
+        
+        Cents compare and sum exactly, where float dollars pick up rounding
+        error. Missing and non-finite prices become <NA>.
+        
+        Args:
+            prices (pd.Series): Float prices
+            
+        Returns:
+            pd.Series: Nullable Int64 cents with the same index
+        """
+        prices = prices.where(np.isfinite(prices))
+        return (prices * 100).round().astype('Int64')
+    
+    def _map_distinct(self, series, func):
+        """
+        Apply a per-value text transform to each distinct value only.
+        
+        Status codes and category names repeat across thousands of rows.
+        The column is factorized, func runs on the small array of distinct
+        values, and the results are spread back to the rows by their codes.
+        High-cardinality columns get func applied directly.
+        
+        Args:
+            series (pd.Series): Text column
+            func (callable): Element-wise transform taking and returning a Series
+            
+        Returns:
+            pd.Series: Transformed column with the same index
+        """
+        if not (series.dtype == object or isinstance(series.dtype, pd.StringDtype)):
+            return func(series)
+        
+        codes, uniques = pd.factorize(series)
+        if len(uniques) > len(series) * _UNIQUE_RATIO:
+            return func(series)
+        
+        mapped = func(pd.Series(uniques, dtype=series.dtype))
+        # Missing values have code -1, which picks the trailing NaN
+        values = np.append(mapped.to_numpy(dtype=object, na_value=np.nan), np.nan)
+        return pd.Series(values[codes], index=series.index, dtype=mapped.dtype, name=series.name)
+    
+    def _strip_case(self, series, case):
+        """
+        Trim whitespace and change the case of a text column.
+        
+        Text columns run through pyarrow.compute kernels, which work on
+        the whole buffer in C++ instead of calling a Python string method
+        per value. Columns pyarrow can't read as strings (mixed types) use
+        pandas' .str methods.
+        
+        Args:
+            series (pd.Series): Text column
+            case (str): 'title', 'lower' or 'upper'
+            
+        Returns:
+            pd.Series: Transformed column with the same dtype and index
+        """
+        arr = self._string_array(series)
+        if arr is not None:
+            kernel = {'title': pc.utf8_title, 'lower': pc.utf8_lower, 'upper': pc.utf8_upper}[case]
+            # Pure-ASCII text can skip UTF-8 decoding (title has no faster ASCII kernel)
+            if case != 'title' and _is_ascii(arr):
+                kernel = {'lower': pc.ascii_lower, 'upper': pc.ascii_upper}[case]
+            result = kernel(pc.utf8_trim_whitespace(arr))
+            return self._from_arrow(result, arr, series)
+        
+        return getattr(series.str.strip().str, case)()
+    
+    def _string_array(self, series):
+        """
+        Read a text column as a pyarrow string array.
+        
+        Object columns and Arrow-backed str columns (pandas' default when
+        pyarrow is installed) qualify; the kernels match what .str does on
+        the latter. Python-backed str columns keep Python's string methods.
+        
+        Args:
+            series (pd.Series): Column to read
+            
+        Returns:
+            pa.Array or None: String values, or None if pyarrow is missing or
+                              the column isn't all text (e.g. mixed types)
+        """
+        dtype = series.dtype
+        arrow_str = isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'
+        if pa is None or not (dtype == object or arrow_str):
+            return None
+        try:
+            return pa.array(series, type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+    
+    def _from_arrow(self, result, source, series):
+        """
+        Turn a pyarrow.compute result back into a column of the input's dtype.
+        
+        Building one Python string per row is the most expensive part of
+        the Arrow path. When the kernels changed nothing (e.g. re-running
+        over already standardized data) the input column is returned as
+        is; the equality check is a single vectorized pass.
+        
+        Args:
+            result (pa.Array): Transformed values
+            source (pa.Array): Values the transform was applied to
+            series (pd.Series): Column that source was built from
+            
+        Returns:
+            pd.Series: Column with the same dtype and index
+        """
+        if source.null_count == 0 and pc.all(pc.equal(result, source)).as_py():
+            return series
+        
+        if series.dtype != object:
+            # str columns take the Arrow buffers without making Python strings
+            values = series.dtype.__from_arrow__(result)
+            return pd.Series(values, index=series.index, name=series.name)
+        
+        values = result.to_numpy(zero_copy_only=False)
+        # Arrow nulls come back as None; keep pandas' NaN
+        values[pd.isna(values)] = np.nan
+        return pd.Series(values, index=series.index, dtype=object, name=series.name)
+    
     def add_source_column(self, dataframes_dict):
         """
         Add a 'data_source' column to track where each record came from.
@@ -190,10 +554,10 @@ class DataMerger:
         updated_dict = {}
         
         for source_name, df in dataframes_dict.items():
-            df_copy = df.copy()
+            df_copy = df.copy(deep=False)
             df_copy['data_source'] = source_name
             updated_dict[source_name] = df_copy
-            self.logger.debug(f"Added source column to '{source_name}'")
+            self.logger.debug("Added source column to '%s'", source_name)
         
         return updated_dict
 
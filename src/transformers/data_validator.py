@@ -10,11 +10,22 @@ Business Logic:
 - Automated validation saves manual inspection time
 """
 
+import hashlib
+import io
+import json
+import os
+
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import Dict, Any, List
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
 
 class DataValidator:
     """
@@ -35,28 +46,28 @@ class DataValidator:
         self.config = config
         self.logger = logger
         self.report_config = config.get('reporting', {})
+        self._last_report_key = None
     
-    def validate(self, df, source_name="unknown"):
+    def validate(self, df, source_name="unknown", write_report=None):
         """
         Validate data quality and generate report.
         
         Args:
             df (pd.DataFrame): Data to validate
             source_name (str): Name of data source
+            write_report (bool, optional): Write the quality report file.
+                                           Uses reporting.enabled if None.
             
         Returns:
             dict: Validation results and quality metrics
         """
-        self.logger.info(f"Starting data validation for '{source_name}'")
+        self.logger.info("Starting data validation for '%s'", source_name)
         
         validation_results = {
             'source_name': source_name,
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'shape': df.shape,
-            'completeness': self._check_completeness(df),
-            'uniqueness': self._check_uniqueness(df),
-            'validity': self._check_validity(df),
-            'consistency': self._check_consistency(df),
+            **self._check_all(df),
             'quality_score': 0  # Will calculate at end
         }
         
@@ -64,32 +75,69 @@ class DataValidator:
         validation_results['quality_score'] = self._calculate_quality_score(validation_results)
         
         self.logger.info(
-            f"Validation complete for '{source_name}': "
-            f"Quality Score = {validation_results['quality_score']}/100"
+            "Validation complete for '%s': Quality Score = %s/100",
+            source_name, validation_results['quality_score']
         )
         
-        # Generate report if configured
-        if self.report_config.get('enabled', True):
+        # Generate report if configured (or explicitly requested)
+        if write_report is None:
+            write_report = self.report_config.get('enabled', True)
+        if write_report:
             self._generate_report(validation_results, df)
         
         return validation_results
     
-    def _check_completeness(self, df):
+    def _check_all(self, df):
+        """
+        Run every quality check with shared inputs.
+        
+        The null mask and the dtype-based column lists are computed once
+        here and handed to each check, instead of every check rescanning
+        the frame for them.
+        
+        Args:
+            df (pd.DataFrame): Data to check
+            
+        Returns:
+            dict: completeness, uniqueness, validity and consistency metrics
+        """
+        missing_mask = df.isna().to_numpy()
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        date_cols = df.select_dtypes(include=['datetime64']).columns
+        string_cols = df.select_dtypes(include=['object']).columns
+        
+        return {
+            'completeness': self._check_completeness(df, missing_mask),
+            'uniqueness': self._check_uniqueness(df),
+            'validity': self._check_validity(df, numeric_cols, date_cols),
+            'consistency': self._check_consistency(df, string_cols, missing_mask),
+        }
+    
+    def _check_completeness(self, df, missing_mask=None):
         """
         Check data completeness (missing values).
         
         Args:
             df (pd.DataFrame): Data to check
+            missing_mask (np.ndarray): df.isna() as an array (computed if None)
             
         Returns:
             dict: Completeness metrics
         """
         total_cells = df.shape[0] * df.shape[1]
-        missing_cells = df.isnull().sum().sum()
+        
+        # One boolean matrix serves both the total and the per-column counts
+        if missing_mask is None:
+            missing_mask = df.isna().to_numpy()
+        missing_by_column = missing_mask.sum(axis=0)
+        missing_cells = int(missing_by_column.sum())
         completeness_pct = ((total_cells - missing_cells) / total_cells) * 100
         
-        missing_by_column = df.isnull().sum()
-        columns_with_missing = missing_by_column[missing_by_column > 0].to_dict()
+        columns_with_missing = {
+            col: int(count)
+            for col, count in zip(df.columns, missing_by_column)
+            if count > 0
+        }
         
         return {
             'completeness_percentage': round(completeness_pct, 2),
@@ -108,7 +156,13 @@ class DataValidator:
             dict: Uniqueness metrics
         """
         total_rows = len(df)
-        duplicate_rows = df.duplicated().sum()
+        # One 64-bit hash per row, then a distinct count on that array,
+        # instead of duplicated()'s per-column factorize and boolean mask
+        if total_rows > 0 and len(df.columns) > 0:
+            unique_rows = pd.util.hash_pandas_object(df, index=False).nunique()
+            duplicate_rows = total_rows - unique_rows
+        else:
+            duplicate_rows = df.duplicated().sum()
         uniqueness_pct = ((total_rows - duplicate_rows) / total_rows) * 100 if total_rows > 0 else 100
         
         return {
@@ -117,22 +171,29 @@ class DataValidator:
             'unique_rows': int(total_rows - duplicate_rows)
         }
     
-    def _check_validity(self, df):
+    def _check_validity(self, df, numeric_cols=None, date_cols=None):
         """
         Check data validity (data types, ranges).
         
         Args:
             df (pd.DataFrame): Data to check
+            numeric_cols (list): Numeric columns (detected if None)
+            date_cols (list): Datetime columns (detected if None)
             
         Returns:
             dict: Validity metrics
         """
         validity_issues = []
         
-        # Check numeric columns for negative values where inappropriate
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        # Check numeric columns for negative values where inappropriate.
+        # A min()/max() reduction rules most columns out without building
+        # a boolean mask; rows are only counted when an issue exists.
+        if numeric_cols is None:
+            numeric_cols = df.select_dtypes(include=[np.number]).columns
         for col in numeric_cols:
             if 'price' in col.lower() or 'quantity' in col.lower() or 'amount' in col.lower():
+                if not self._below(df[col].min(), 0):
+                    continue
                 negative_count = (df[col] < 0).sum()
                 if negative_count > 0:
                     validity_issues.append({
@@ -142,9 +203,11 @@ class DataValidator:
                     })
         
         # Check for unrealistic dates (future dates or too old)
-        date_cols = df.select_dtypes(include=['datetime64']).columns
+        if date_cols is None:
+            date_cols = df.select_dtypes(include=['datetime64']).columns
         for col in date_cols:
-            future_dates = (df[col] > pd.Timestamp.now()).sum()
+            now = pd.Timestamp.now()
+            future_dates = (df[col] > now).sum() if self._below(now, df[col].max()) else 0
             if future_dates > 0:
                 validity_issues.append({
                     'column': col,
@@ -152,7 +215,8 @@ class DataValidator:
                     'count': int(future_dates)
                 })
             
-            very_old = (df[col] < pd.Timestamp('1900-01-01')).sum()
+            oldest_valid = pd.Timestamp('1900-01-01')
+            very_old = (df[col] < oldest_valid).sum() if self._below(df[col].min(), oldest_valid) else 0
             if very_old > 0:
                 validity_issues.append({
                     'column': col,
@@ -167,31 +231,57 @@ class DataValidator:
             'issues': validity_issues
         }
     
-    def _check_consistency(self, df):
+    @staticmethod
+    def _below(value, limit):
+        """
+        Compare a column reduction against a limit, treating missing as False.
+        
+        Args:
+            value: Result of min()/max() (may be NaN, NaT or pd.NA)
+            limit: Value to compare against
+            
+        Returns:
+            bool: True if value is present and less than limit
+        """
+        return bool(pd.notna(value) and value < limit)
+    
+    def _check_consistency(self, df, string_cols=None, missing_mask=None):
         """
         Check data consistency (format standardization).
         
         Args:
             df (pd.DataFrame): Data to check
+            string_cols (list): Object columns (detected if None)
+            missing_mask (np.ndarray): df.isna() as an array, reused to skip
+                                       missing values (computed per column if None)
             
         Returns:
             dict: Consistency metrics
         """
         consistency_issues = []
         
+        # Casing styles are a column-wide trait, so a fixed-size random
+        # sample answers "mixed?" at any row count (0 checks every value)
+        sample_size = self.config.get('quality_checks', {}).get('consistency_sample_size', 1024)
+        rng = np.random.default_rng(0)
+        
         # Check string columns for inconsistent casing
-        string_cols = df.select_dtypes(include=['object']).columns
+        if string_cols is None:
+            string_cols = df.select_dtypes(include=['object']).columns
         for col in string_cols:
             if df[col].dtype == 'object':
                 # Sample to check consistency
-                sample = df[col].dropna().astype(str)
+                if missing_mask is None:
+                    present = df[col].notna().to_numpy()
+                else:
+                    present = ~missing_mask[:, df.columns.get_loc(col)]
+                positions = np.flatnonzero(present)
+                if sample_size and len(positions) > sample_size:
+                    positions = np.sort(rng.choice(positions, sample_size, replace=False))
+                sample = df[col].iloc[positions].astype(str)
                 if len(sample) > 0:
                     # Check if mixed case (some uppercase, some lowercase)
-                    has_upper = sample.str.isupper().any()
-                    has_lower = sample.str.islower().any()
-                    has_title = sample.str.istitle().any()
-                    
-                    if sum([has_upper, has_lower, has_title]) > 1:
+                    if self._has_mixed_case(sample):
                         consistency_issues.append({
                             'column': col,
                             'issue': 'mixed_case_formats'
@@ -204,6 +294,43 @@ class DataValidator:
             'issues': consistency_issues
         }
     
+    def _has_mixed_case(self, sample):
+        """
+        Check whether a text column uses more than one casing style.
+        
+        Styles are all-uppercase, all-lowercase and Title Case, tested per
+        value with Python's isupper/islower/istitle rules. With pyarrow the
+        tests run as utf8_is_* kernels over the whole column; either way
+        checking stops once two styles have been seen.
+        
+        Args:
+            sample (pd.Series): Non-missing values as strings
+            
+        Returns:
+            bool: True if at least two casing styles occur
+        """
+        if pa is not None:
+            arr = pa.array(sample, type=pa.string())
+            checks = [
+                lambda: pc.any(pc.utf8_is_upper(arr)).as_py(),
+                lambda: pc.any(pc.utf8_is_lower(arr)).as_py(),
+                lambda: pc.any(pc.utf8_is_title(arr)).as_py(),
+            ]
+        else:
+            checks = [
+                lambda: sample.str.isupper().any(),
+                lambda: sample.str.islower().any(),
+                lambda: sample.str.istitle().any(),
+            ]
+        
+        styles_seen = 0
+        for check in checks:
+            if check():
+                styles_seen += 1
+                if styles_seen > 1:
+                    return True
+        return False
+    
     def _calculate_quality_score(self, validation_results):
         """
         Calculate overall quality score (0-100).
@@ -244,12 +371,25 @@ class DataValidator:
             df (pd.DataFrame): Original data
         """
         report_path = self.report_config.get('output_path', 'reports/data_quality_report.txt')
+        key_path = report_path + '.key'
+        
+        # Same source and same data as the report on disk: skip describe() and the rewrite
+        report_key = None
+        if self.report_config.get('skip_unchanged', True):
+            report_key = self._report_key(validation_results['source_name'], df)
+            if report_key is not None and os.path.exists(report_path):
+                if self._last_report_key is None and os.path.exists(key_path):
+                    with open(key_path, 'r', encoding='utf-8') as f:
+                        self._last_report_key = f.read()
+                if report_key == self._last_report_key:
+                    self.logger.info("Data unchanged, keeping quality report: %s", report_path)
+                    return
         
         # Create reports directory if it doesn't exist
-        import os
         os.makedirs(os.path.dirname(report_path), exist_ok=True)
         
-        with open(report_path, 'w', encoding='utf-8') as f:
+        # Build the report in memory and write the file in one call
+        with io.StringIO() as f:
             f.write("=" * 80 + "\n")
             f.write("DATA QUALITY REPORT\n")
             f.write("=" * 80 + "\n\n")
@@ -307,8 +447,23 @@ class DataValidator:
                 f.write("=" * 80 + "\n")
                 f.write("STATISTICAL SUMMARY\n")
                 f.write("=" * 80 + "\n\n")
-                f.write(str(df.describe(include='all')))
+                # Wide frames: describe only the leading columns (0 = all)
+                stats_df = df
+                max_columns = self.report_config.get('max_stat_columns', 20)
+                if max_columns and df.shape[1] > max_columns:
+                    f.write(f"(First {max_columns} of {df.shape[1]} columns)\n")
+                    stats_df = df.iloc[:, :max_columns]
+                
+                # Numeric summary only: unique/top/freq for text columns
+                # needs a hash pass per column, so it's opt-in
+                f.write(str(stats_df.describe()))
                 f.write("\n\n")
+                if self.report_config.get('include_object_stats', False):
+                    text_cols = stats_df.select_dtypes(include=['object', 'string', 'category']).columns
+                    if len(text_cols) > 0:
+                        f.write("Distinct values per text column:\n")
+                        f.write(str(stats_df[text_cols].nunique()))
+                        f.write("\n\n")
             
             # Sample Data (if configured)
             if self.report_config.get('include_samples', True):
@@ -322,8 +477,50 @@ class DataValidator:
             f.write("=" * 80 + "\n")
             f.write("END OF REPORT\n")
             f.write("=" * 80 + "\n")
+            report = f.getvalue()
+        
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(report)
+        
+        self.logger.info("Data quality report saved to: %s", report_path)
+        
+        # Sidecar key lets the next run (or process) recognise unchanged data
+        if report_key is not None:
+            with open(key_path, 'w', encoding='utf-8') as f:
+                f.write(report_key)
+            self._last_report_key = report_key
+    
+    def _report_key(self, source_name, df):
+        """
+        Fingerprint a frame for the report cache.
         
-        self.logger.info(f"Data quality report saved to: {report_path}")
+        SHA-1 over the validator configuration, source name, shape, column
+        names and dtypes, and the per-row 64-bit hashes in row order, so
+        any changed, reordered or retyped cell or any changed setting
+        changes the key.
+        
+        Args:
+            source_name (str): Name of data source
+            df (pd.DataFrame): Data the report describes
+            
+        Returns:
+            str: Hex digest, or None if the values or settings can't be hashed
+        """
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+            header = json.dumps([
+                self.config,
+                source_name,
+                list(df.shape),
+                [str(col) for col in df.columns],
+                [str(dtype) for dtype in df.dtypes],
+            ], sort_keys=True, default=str)
+        except TypeError:
+            return None
+        
+        key = hashlib.sha1(header.encode('utf-8'))
+        key.update(row_hashes.tobytes())
+        return key.hexdigest()
 
 
 # Example usage and testing
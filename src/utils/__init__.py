@@ -7,17 +7,25 @@ Available modules:
 - logger: Centralized logging system
 - config_loader: Configuration management
 - db_connection: Database connection utilities
+- dtype_optimizer: DataFrame memory reduction
+- counting_writer: Byte-counting file wrapper for loaders
 """
 
 from .logger import get_logger, PipelineLogger
 from .config_loader import ConfigLoader
-from .db_connection import get_database_connection, PostgreSQLConnection, MySQLConnection
+from .counting_writer import CountingWriter
+from .dtype_optimizer import optimize_dtypes, find_low_cardinality_columns
+from .db_connection import get_database_connection, close_all_pools, PostgreSQLConnection, MySQLConnection
 
 __all__ = [
     'get_logger',
     'PipelineLogger',
     'ConfigLoader',
     'get_database_connection',
+    'close_all_pools',
+    'optimize_dtypes',
+    'find_low_cardinality_columns',
+    'CountingWriter',
     'PostgreSQLConnection',
     'MySQLConnection'
 ]
\ No newline at end of file
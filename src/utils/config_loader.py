@@ -11,10 +11,22 @@ Business Logic:
 - Make it easy to switch between environments (dev, staging, prod)
 """
 
+import json
 import yaml
 import os
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib JSON parser
+    orjson = None
+
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ConfigLoader:
     """
@@ -33,6 +45,9 @@ class ConfigLoader:
         """
         self.config_path = config_path
         self.config = None
+        self._flat = {}
+        self._enabled_sources = ()
+        self._enabled_destinations = ()
         self.load_config()
     
     def load_config(self):
@@ -43,21 +58,135 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If config file is invalid YAML
         """
-        if not os.path.exists(self.config_path):
+        # One stat both checks the file exists and keys the warm-start cache
+        try:
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found: {self.config_path}\n"
                 f"Please ensure the config file exists at this location."
             )
         
+        # Warm start: reuse the parsed config if the YAML file hasn't changed
+        cache_key = f"{st.st_mtime_ns}:{st.st_size}"
+        cached = self._read_cache(cache_key)
+        if cached is not None:
+            self.config = cached
+            self._index_config()
+            return
+        
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+            # Read the whole file in one call; the loader decodes UTF-8 bytes itself
+            with open(self.config_path, 'rb') as f:
+                raw = f.read()
+            self.config = yaml.load(raw, Loader=_YamlLoader)
+            
+            self._index_config()
             
             # Validate configuration structure
             self._validate_config()
             
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in configuration file: {e}")
+        
+        # Only configs that passed validation are cached
+        self._write_cache(cache_key)
+    
+    def _index_config(self):
+        """
+        Precompute lookups that only depend on the loaded config.
+        
+        The config doesn't change after loading, so the getters and
+        validation share the enabled source/destination tuples instead of
+        re-filtering each time, and get() reads dotted paths from a flat map.
+        """
+        self._flat = dict(self._flatten(self.config)) if isinstance(self.config, dict) else {}
+        
+        def enabled(section):
+            entries = self.config.get(section, {}) if isinstance(self.config, dict) else {}
+            return tuple(
+                name for name, config in (entries or {}).items()
+                if isinstance(config, dict) and config.get('enabled', False)
+            )
+        
+        self._enabled_sources = enabled('sources')
+        self._enabled_destinations = enabled('destinations')
+    
+    def _flatten(self, node, prefix=''):
+        """
+        Yield every dotted path in a nested config with its value.
+        
+        Nested dicts are yielded themselves as well as their children, so
+        get('sources') still returns the whole section. Keys that aren't
+        strings or contain '.' can't be addressed with dot notation and
+        are skipped.
+        
+        Args:
+            node (dict): Config mapping to walk
+            prefix (str): Dotted path of node ('' for the root)
+            
+        Yields:
+            tuple: (dotted path, value)
+        """
+        for key, value in node.items():
+            if not isinstance(key, str) or '.' in key:
+                continue
+            path = prefix + key
+            yield path, value
+            if isinstance(value, dict):
+                yield from self._flatten(value, path + '.')
+    
+    def _read_cache(self, cache_key):
+        """
+        Load the parsed configuration saved next to the YAML file.
+        
+        Args:
+            cache_key (str): mtime and size of the YAML file
+            
+        Returns:
+            dict: Cached configuration, or None if missing, stale or unreadable
+        """
+        try:
+            with open(self.config_path + '.json', 'rb') as f:
+                payload = f.read()
+            cached = orjson.loads(payload) if orjson is not None else json.loads(payload)
+            key, config = cached['key'], cached['config']
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        
+        return config if key == cache_key else None
+    
+    def _write_cache(self, cache_key):
+        """
+        Save the parsed configuration next to the YAML file.
+        
+        Stored as JSON, which parses far faster than YAML and can't run code
+        when loaded. Configs that don't survive a JSON round trip unchanged
+        (dates, non-string keys) aren't cached. Written to a temporary file
+        and renamed, so a concurrent start never reads a partial cache. A
+        read-only config directory just means no cache.
+        
+        Args:
+            cache_key (str): mtime and size of the YAML file
+        """
+        try:
+            payload = json.dumps({'key': cache_key, 'config': self.config})
+            if json.loads(payload)['config'] != self.config:
+                return
+        except (TypeError, ValueError):
+            return
+        
+        cache_path = self.config_path + '.json'
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
     
     def _validate_config(self):
         """
@@ -76,26 +205,14 @@ class ConfigLoader:
                 )
         
         # Validate at least one source is enabled
-        sources = self.config.get('sources', {})
-        enabled_sources = [
-            source for source, config in sources.items()
-            if isinstance(config, dict) and config.get('enabled', False)
-        ]
-        
-        if not enabled_sources:
+        if not self._enabled_sources:
             raise ValueError(
                 "At least one data source must be enabled in configuration.\n"
                 "Set 'enabled: true' for at least one source in the 'sources' section."
             )
         
         # Validate at least one destination is enabled
-        destinations = self.config.get('destinations', {})
-        enabled_destinations = [
-            dest for dest, config in destinations.items()
-            if isinstance(config, dict) and config.get('enabled', False)
-        ]
-        
-        if not enabled_destinations:
+        if not self._enabled_destinations:
             raise ValueError(
                 "At least one destination must be enabled in configuration.\n"
                 "Set 'enabled: true' for at least one destination in the 'destinations' section."
@@ -116,16 +233,8 @@ class ConfigLoader:
             >>> config.get('sources.csv.file_path')
             'data/raw/shipping_data.csv'
         """
-        keys = key_path.split('.')
-        value = self.config
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        
-        return value
+        # Every path was flattened at load time: one dict lookup
+        return self._flat.get(key_path, default)
     
     def get_enabled_sources(self):
         """
@@ -134,11 +243,7 @@ class ConfigLoader:
         Returns:
             list: Names of enabled sources
         """
-        sources = self.config.get('sources', {})
-        return [
-            source for source, config in sources.items()
-            if isinstance(config, dict) and config.get('enabled', False)
-        ]
+        return list(self._enabled_sources)
     
     def get_enabled_destinations(self):
         """
@@ -147,11 +252,7 @@ class ConfigLoader:
         Returns:
             list: Names of enabled destinations
         """
-        destinations = self.config.get('destinations', {})
-        return [
-            dest for dest, config in destinations.items()
-            if isinstance(config, dict) and config.get('enabled', False)
-        ]
+        return list(self._enabled_destinations)
     
     def get_source_config(self, source_name):
         """
@@ -0,0 +1,54 @@
+"""
+Counting Writer Module
+======================
+Binary file wrapper that tallies the bytes written through it.
+
+Business Logic:
+- Loaders log the size of every file they write
+- Counting bytes on the way out avoids a separate stat call after
+  each write, which is slow on network file systems
+- Wrapping below any compression layer counts the on-disk size
+"""
+
+import io
+
+
+class CountingWriter(io.RawIOBase):
+    """
+    Writable stream that forwards to a binary file and counts bytes.
+
+    Closing the writer leaves the wrapped file open, so writers that close
+    their sink (e.g. pyarrow compressed streams) don't close the caller's file.
+    """
+
+    def __init__(self, raw):
+        """
+        Wrap a binary file.
+
+        Args:
+            raw: File object opened in binary write mode
+        """
+        super().__init__()
+        self.raw = raw
+        self.bytes_written = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        """
+        Write bytes to the wrapped file.
+
+        Args:
+            data (bytes): Bytes to write
+
+        Returns:
+            int: Number of bytes written
+        """
+        written = self.raw.write(data)
+        self.bytes_written += written
+        return written
+
+    def flush(self):
+        if not self.closed:
+            self.raw.flush()
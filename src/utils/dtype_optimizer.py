@@ -0,0 +1,89 @@
+"""
+Dtype Optimizer Module
+======================
+Shrinks DataFrame memory by narrowing column dtypes.
+
+Business Logic:
+- pandas defaults to 64-bit numbers and object strings for everything
+- Most columns fit in much smaller types (int8/int16/int32, and float32
+  where that loses no precision)
+- Repeated strings (status, region, category) are cheaper as categoricals
+- Smaller frames move faster through every transform and load step
+"""
+
+import logging
+import pandas as pd
+import numpy as np
+
+
+def optimize_dtypes(df, downcast=True, categorical_columns=None, logger=None):
+    """
+    Narrow numeric dtypes and encode low-cardinality string columns.
+    
+    Args:
+        df (pd.DataFrame): Data to optimize (modified in place)
+        downcast (bool): Downcast integer columns to the smallest dtype that
+                         holds their values, and float64 columns to float32
+                         where every value survives the round trip exactly
+        categorical_columns (list, optional): Columns to convert to 'category'
+        logger: Logger instance (optional)
+        
+    Returns:
+        pd.DataFrame: The same DataFrame with narrowed dtypes
+    """
+    if not downcast and not categorical_columns:
+        return df
+    
+    # Deep memory usage scans every string, so only measure when it's logged
+    log_memory = logger is not None and logger.isEnabledFor(logging.DEBUG)
+    if log_memory:
+        memory_before = df.memory_usage(deep=True).sum()
+    
+    if downcast:
+        for col in df.select_dtypes(include=['integer']).columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        # float32 keeps ~7 significant digits; a column is only narrowed
+        # if no value changes (123456.789 would become 123456.79)
+        for col in df.select_dtypes(include=['float64']).columns:
+            narrowed = df[col].astype('float32')
+            if narrowed.astype('float64').equals(df[col]):
+                df[col] = narrowed
+    
+    for col in categorical_columns or []:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    
+    if log_memory:
+        memory_after = df.memory_usage(deep=True).sum()
+        logger.debug(
+            f"Optimized dtypes: {memory_before / 1024:.1f} KB -> "
+            f"{memory_after / 1024:.1f} KB"
+        )
+    
+    return df
+
+
+def find_low_cardinality_columns(df, max_ratio=0.5):
+    """
+    Find string columns whose values repeat enough to store as categories.
+    
+    Args:
+        df (pd.DataFrame): Data to inspect
+        max_ratio (float): Maximum distinct-values-to-rows ratio
+        
+    Returns:
+        list: Names of low-cardinality string columns
+    """
+    if len(df) == 0:
+        return []
+    
+    columns = []
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        try:
+            distinct = df[col].nunique(dropna=True)
+        except TypeError:  # Unhashable values (lists/dicts from nested JSON)
+            continue
+        if distinct / len(df) < max_ratio:
+            columns.append(col)
+    
+    return columns
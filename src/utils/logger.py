@@ -9,14 +9,60 @@ Business Logic:
 - Separate log levels help filter information (DEBUG for development, INFO for production)
 - File logs persist for historical analysis
 - Console logs provide real-time feedback during execution
+- Handlers can run on a background thread so logging never blocks the pipeline
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 
 
+# Background listeners started for queued loggers: (logger, queue handler, listener)
+_listeners = []
+
+# Level names accepted in the logging config
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
+# Loggers already configured by get_logger, keyed by name
+_loggers = {}
+_loggers_lock = threading.Lock()
+
+
+def _stop_listeners():
+    """Flush and stop every queue listener (registered with atexit)."""
+    for _, _, listener in _listeners:
+        listener.stop()
+
+
+def _use_direct_handlers():
+    """
+    Swap queued loggers back to their real handlers in a forked child.
+    
+    Only the forking thread survives a fork, so the child has no listener
+    to drain the queue; it writes through the inherited handlers instead.
+    """
+    for logger, queue_handler, listener in _listeners:
+        logger.removeHandler(queue_handler)
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+    _listeners.clear()
+
+
+atexit.register(_stop_listeners)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_use_direct_handlers)
+
+
 class PipelineLogger:
     """
     Centralized logger for ETL pipeline operations.
@@ -45,8 +91,9 @@ class PipelineLogger:
             logging.Logger: Configured logger instance
         """
         # Create logger
+        level = self._get_log_level()
         logger = logging.getLogger(self.name)
-        logger.setLevel(self._get_log_level())
+        logger.setLevel(level)
         
         # Prevent duplicate handlers if logger already exists
         if logger.handlers:
@@ -61,7 +108,7 @@ class PipelineLogger:
         # Console Handler (logs to terminal)
         if self.config.get('log_to_console', True):
             console_handler = logging.StreamHandler()
-            console_handler.setLevel(self._get_log_level())
+            console_handler.setLevel(level)
             console_handler.setFormatter(formatter)
             logger.addHandler(console_handler)
         
@@ -78,10 +125,23 @@ class PipelineLogger:
                 maxBytes=self.config.get('max_file_size_mb', 10) * 1024 * 1024,  # Convert MB to bytes
                 backupCount=self.config.get('backup_count', 5)
             )
-            file_handler.setLevel(self._get_log_level())
+            file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
             logger.addHandler(file_handler)
         
+        # Format and write records on a background thread; the caller
+        # only pays for putting the record on a queue
+        if self.config.get('use_queue', True) and logger.handlers:
+            handlers = list(logger.handlers)
+            log_queue = queue.SimpleQueue()
+            queue_handler = QueueHandler(log_queue)
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            for handler in handlers:
+                logger.removeHandler(handler)
+            logger.addHandler(queue_handler)
+            listener.start()
+            _listeners.append((logger, queue_handler, listener))
+        
         return logger
     
     def _get_log_level(self):
@@ -92,14 +152,7 @@ class PipelineLogger:
             int: Logging level constant
         """
         level_str = self.config.get('level', 'INFO').upper()
-        level_map = {
-            'DEBUG': logging.DEBUG,
-            'INFO': logging.INFO,
-            'WARNING': logging.WARNING,
-            'ERROR': logging.ERROR,
-            'CRITICAL': logging.CRITICAL
-        }
-        return level_map.get(level_str, logging.INFO)
+        return _LEVEL_MAP.get(level_str, logging.INFO)
     
     def get_logger(self):
         """
@@ -117,9 +170,12 @@ class PipelineLogger:
         Args:
             pipeline_name (str): Name of the pipeline
         """
+        # Skip building the banner (and its timestamp) when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info("=" * 80)
-        self.logger.info(f"PIPELINE START: {pipeline_name}")
-        self.logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self.logger.info("PIPELINE START: %s", pipeline_name)
+        self.logger.info("Timestamp: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         self.logger.info("=" * 80)
     
     def log_pipeline_end(self, pipeline_name, success=True):
@@ -130,10 +186,12 @@ class PipelineLogger:
             pipeline_name (str): Name of the pipeline
             success (bool): Whether pipeline completed successfully
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         status = "SUCCESS" if success else "FAILED"
         self.logger.info("=" * 80)
-        self.logger.info(f"PIPELINE END: {pipeline_name} - {status}")
-        self.logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self.logger.info("PIPELINE END: %s - %s", pipeline_name, status)
+        self.logger.info("Timestamp: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         self.logger.info("=" * 80)
     
     def log_step_start(self, step_name):
@@ -143,8 +201,10 @@ class PipelineLogger:
         Args:
             step_name (str): Name of the step
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info("-" * 80)
-        self.logger.info(f"STEP START: {step_name}")
+        self.logger.info("STEP START: %s", step_name)
         self.logger.info("-" * 80)
     
     def log_step_end(self, step_name, records_processed=None):
@@ -155,10 +215,12 @@ class PipelineLogger:
             step_name (str): Name of the step
             records_processed (int, optional): Number of records processed
         """
-        msg = f"STEP END: {step_name}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if records_processed is not None:
-            msg += f" - {records_processed} records processed"
-        self.logger.info(msg)
+            self.logger.info("STEP END: %s - %s records processed", step_name, records_processed)
+        else:
+            self.logger.info("STEP END: %s", step_name)
         self.logger.info("-" * 80)
 
 
@@ -166,6 +228,10 @@ def get_logger(name, config):
     """
     Factory function to get a pipeline logger.
     
+    Each name is configured once per process; later calls return the same
+    logger without rebuilding formatters and handlers, so the first
+    configuration for a name wins.
+    
     Args:
         name (str): Logger name
         config (dict): Logging configuration
@@ -173,8 +239,17 @@ def get_logger(name, config):
     Returns:
         logging.Logger: Configured logger
     """
-    pipeline_logger = PipelineLogger(name, config)
-    return pipeline_logger.get_logger()
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
+    
+    with _loggers_lock:
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = PipelineLogger(name, config).get_logger()
+            _loggers[name] = logger
+    
+    return logger
 
 
 # Example usage:
@@ -7,6 +7,8 @@ Simple script to test all extractors from the project root.
 import sys
 import os
 
+import pandas as pd
+
 # Add project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -15,15 +17,16 @@ from src.extractors.csv_extractor import CSVExtractor
 from src.extractors.api_extractor import APIExtractor
 
 
-def test_csv_extractor():
+def test_csv_extractor(config_loader=None):
     """Test CSV extractor with your e-commerce data."""
     print("\n" + "="*80)
     print("TESTING CSV EXTRACTOR")
     print("="*80)
     
     try:
-        # Load configuration
-        config_loader = ConfigLoader('config/pipeline_config.yaml')
+        # Load configuration (shared by main(), or loaded here when run alone)
+        if config_loader is None:
+            config_loader = ConfigLoader('config/pipeline_config.yaml')
         csv_config = config_loader.get_source_config('csv')
         log_config = config_loader.get_logging_config()
         
@@ -39,9 +42,25 @@ def test_csv_extractor():
             
             print("\n✅ CSV EXTRACTION SUCCESSFUL!")
             print(f"Shape: {df.shape[0]} rows, {df.shape[1]} columns")
-            print(f"\nColumns: {list(df.columns)}")
+            print(f"\nColumns: {df.columns.tolist()}")
             print(f"\nFirst 5 rows:")
             print(df.head())
+            
+            # Blank and 'NA' cells must come back missing, as pd.read_csv reads them
+            baseline = pd.read_csv(
+                extractor.file_path,
+                delimiter=extractor.delimiter,
+                encoding=extractor._detect_encoding(),
+                usecols=extractor.columns
+            )
+            mismatched = [
+                col for col in df.columns
+                if df[col].isna().sum() != baseline[col].isna().sum()
+            ]
+            if mismatched:
+                print(f"\n❌ Missing-value counts differ from pd.read_csv in: {mismatched}")
+                return None
+            print("\n✅ Missing-value counts match pd.read_csv")
             print("\n" + "="*80)
             
             return df
@@ -56,26 +75,25 @@ def test_csv_extractor():
         return None
 
 
-def test_api_extractor():
+def test_api_extractor(config_loader=None):
     """Test API extractor with Fake Store API."""
     print("\n" + "="*80)
     print("TESTING API EXTRACTOR")
     print("="*80)
     
     try:
-        # Load configuration
-        config_loader = ConfigLoader('config/pipeline_config.yaml')
+        # Load configuration (shared by main(), or loaded here when run alone)
+        if config_loader is None:
+            config_loader = ConfigLoader('config/pipeline_config.yaml')
         api_config = config_loader.get_source_config('api')
         log_config = config_loader.get_logging_config()
         
         # Set up logger
         logger = get_logger('api_test', log_config)
         
-        # Create extractor
-        extractor = APIExtractor(api_config, logger)
-        
-        # Extract from all endpoints
-        results = extractor.extract()
+        # Create extractor and extract from all endpoints
+        with APIExtractor(api_config, logger) as extractor:
+            results = extractor.extract()
         
         print("\n✅ API EXTRACTION SUCCESSFUL!")
         
@@ -83,7 +101,7 @@ def test_api_extractor():
             if df is not None:
                 print(f"\n{endpoint_name.upper()}:")
                 print(f"  Shape: {df.shape[0]} rows, {df.shape[1]} columns")
-                print(f"  Columns: {list(df.columns)[:5]}...")  # Show first 5 columns
+                print(f"  Columns: {df.columns[:5].tolist()}...")  # Show first 5 columns
                 print(f"  First 2 rows:")
                 print(df.head(2))
             else:
@@ -105,11 +123,14 @@ def main():
     print("ETL PIPELINE - EXTRACTOR TESTS")
     print("="*80)
     
+    # Parse and validate the configuration once for every test
+    config_loader = ConfigLoader('config/pipeline_config.yaml')
+    
     # Test CSV extractor
-    csv_data = test_csv_extractor()
+    csv_data = test_csv_extractor(config_loader)
     
     # Test API extractor
-    api_data = test_api_extractor()
+    api_data = test_api_extractor(config_loader)
     
     # Summary
     print("\n" + "="*80)
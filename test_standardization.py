@@ -3,14 +3,29 @@ Simple Standardization Test
 """
 import sys
 import os
+import argparse
+import hashlib
+import json
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import pandas as pd
 from src.utils import ConfigLoader, get_logger
+from src.extractors import csv_extractor
 from src.extractors.csv_extractor import CSVExtractor
+from src.transformers import data_cleaner, _outlier_kernels
+from src.utils import dtype_optimizer
 from src.transformers.data_cleaner import DataCleaner
 from src.transformers.data_merger import DataMerger
 from src.transformers.data_validator import DataValidator
 
+# The quality report file is only needed when it will be read
+parser = argparse.ArgumentParser(description="Run extract, clean, standardize and validate on the CSV source")
+parser.add_argument('--write-report', action='store_true',
+                    help="Also write reports/data_quality_report.txt")
+parser.add_argument('--no-cache', action='store_true',
+                    help="Re-extract and re-clean instead of reusing .cache/etl")
+args = parser.parse_args()
+
 # Load configuration
 config_loader = ConfigLoader('config/pipeline_config.yaml')
 transform_config = config_loader.get_transform_config()
@@ -18,22 +33,51 @@ csv_config = config_loader.get_source_config('csv')
 log_config = config_loader.get_logging_config()
 logger = get_logger('test', log_config)
 
+# Cleaned data from earlier runs is kept here (Parquet, keyed by inputs)
+CACHE_DIR = '.cache/etl'
+
 # Extract and clean
 print("\n" + "="*80)
 print("STEP 1: EXTRACT & CLEAN")
 print("="*80)
-extractor = CSVExtractor(csv_config, logger)
-df = extractor.extract()
 
-cleaner = DataCleaner(transform_config, logger)
-df_clean = cleaner.clean(df, "e-commerce")
+# The key covers the CSV file, the source and transform settings and the
+# code that extracts and cleans it. Other changes (e.g. library upgrades)
+# aren't tracked; run with --no-cache to rebuild the cached frame.
+csv_stat = os.stat(csv_config['file_path'])
+cache_hash = hashlib.sha1(f"{csv_stat.st_mtime_ns}:{csv_stat.st_size}:".encode())
+cache_hash.update(json.dumps(csv_config, sort_keys=True, default=str).encode())
+cache_hash.update(json.dumps(transform_config, sort_keys=True, default=str).encode())
+for module in (csv_extractor, dtype_optimizer, data_cleaner, _outlier_kernels):
+    with open(module.__file__, 'rb') as f:
+        cache_hash.update(f.read())
+cache_path = os.path.join(CACHE_DIR, f"{cache_hash.hexdigest()}.parquet")
+
+if not args.no_cache and os.path.exists(cache_path):
+    df_clean = pd.read_parquet(cache_path)
+    print(f"Loaded cleaned data from cache: {cache_path}")
+else:
+    extractor = CSVExtractor(csv_config, logger)
+    df = extractor.extract()
+    
+    cleaner = DataCleaner(transform_config, logger)
+    df_clean = cleaner.clean(df, "e-commerce")
+    del df  # Only the cleaned frame is needed from here on
+    
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        df_clean.to_parquet(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except ImportError:  # No Parquet engine installed; always re-clean
+        pass
 
 # Show BEFORE standardization
 print("\n" + "="*80)
 print("BEFORE STANDARDIZATION")
 print("="*80)
 print("\nFirst 5 rows:")
-print(df_clean[['order_id', 'customer_name', 'status', 'quantity', 'price']].head())
+print(df_clean.head()[['order_id', 'customer_name', 'status', 'quantity', 'price']])
 print(f"\nNegative quantities: {(df_clean['quantity'] < 0).sum()}")
 print(f"Price data type: {df_clean['price'].dtype}")
 
@@ -43,38 +87,46 @@ print("STEP 2: STANDARDIZE")
 print("="*80)
 merger = DataMerger(transform_config, logger)
 df_std = merger.standardize(df_clean)
+del df_clean  # Release the pre-standardization frame before validating
 
 # Show AFTER standardization
 print("\n" + "="*80)
 print("AFTER STANDARDIZATION")
 print("="*80)
+# type_conversions.price_cents stores prices as integer cents
+price_col = 'price_cents' if 'price_cents' in df_std.columns else 'price'
 print("\nFirst 5 rows:")
-print(df_std[['order_id', 'customer_name', 'status', 'quantity', 'price']].head())
+print(df_std.head()[['order_id', 'customer_name', 'status', 'quantity', price_col]])
 print(f"\nNegative quantities: {(df_std['quantity'] < 0).sum()}")
-print(f"Price data type: {df_std['price'].dtype}")
+print(f"Price data type: {df_std[price_col].dtype}")
 
 # Validate
 print("\n" + "="*80)
 print("STEP 3: VALIDATE")
 print("="*80)
 validator = DataValidator(transform_config, logger)
-results = validator.validate(df_std, "e-commerce_final")
+results = validator.validate(df_std, "e-commerce_final", write_report=args.write_report)
 
-print(f"\n✓ Quality Score: {results['quality_score']}/100")
-print(f"✓ Completeness: {results['completeness']['completeness_percentage']}%")
-print(f"✓ Uniqueness: {results['uniqueness']['uniqueness_percentage']}%")
-print(f"✓ Validity: {results['validity']['validity_percentage']}%")
-print(f"✓ Consistency: {results['consistency']['consistency_percentage']}%")
+# Build the summary and write it in one call instead of a print per line
+lines = [
+    f"\n✓ Quality Score: {results['quality_score']}/100",
+    f"✓ Completeness: {results['completeness']['completeness_percentage']}%",
+    f"✓ Uniqueness: {results['uniqueness']['uniqueness_percentage']}%",
+    f"✓ Validity: {results['validity']['validity_percentage']}%",
+    f"✓ Consistency: {results['consistency']['consistency_percentage']}%",
+]
 
 if results['validity']['issues']:
-    print("\nValidity Issues:")
-    for issue in results['validity']['issues']:
-        print(f"  - {issue}")
+    lines.append("\nValidity Issues:")
+    lines.extend(f"  - {issue}" for issue in results['validity']['issues'])
 
 if results['consistency']['issues']:
-    print("\nConsistency Issues:")
-    for issue in results['consistency']['issues']:
-        print(f"  - {issue}")
+    lines.append("\nConsistency Issues:")
+    lines.extend(f"  - {issue}" for issue in results['consistency']['issues'])
+
+if args.write_report:
+    lines.append("\n✓ Report saved to: reports/data_quality_report.txt")
+lines.append("="*80 + "\n")
 
-print("\n✓ Report saved to: reports/data_quality_report.txt")
-print("="*80 + "\n")
\ No newline at end of file
+sys.stdout.write("\n".join(lines) + "\n")
+sys.stdout.flush()
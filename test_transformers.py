@@ -0,0 +1,144 @@
+"""
+Test Transformers Script
+========================
+Runs small synthetic frames through the transformers and checks the
+behaviour the pipeline relies on.
+"""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.utils import get_logger
+from src.transformers.data_cleaner import DataCleaner
+from src.transformers.data_validator import DataValidator
+
+
+def sample_frame():
+    """Small order frame with a missing value and a duplicate customer."""
+    return pd.DataFrame({
+        'order_id': ['ORD-1', 'ORD-2', 'ORD-3', 'ORD-4'],
+        'customer_name': ['John Doe', 'Jane Roe', 'John Doe', None],
+        'quantity': [2, 10, 3, 1],
+        'price': [1.0, 5.5, 1200.0, 8.25],
+    })
+
+
+def baseline_remove_outliers(df, method, threshold):
+    """The original per-column loop: each column is screened on the rows earlier columns kept."""
+    for col in df.select_dtypes(include=[np.number]).columns:
+        if method == 'iqr':
+            q1, q3 = df[col].quantile(0.25), df[col].quantile(0.75)
+            outliers = (df[col] < q1 - threshold * (q3 - q1)) | (df[col] > q3 + threshold * (q3 - q1))
+        else:
+            outliers = np.abs((df[col] - df[col].mean()) / df[col].std()) > threshold
+        if outliers.sum() > 0:
+            df = df[~outliers]
+    return df
+
+
+def test_outlier_removal(logger):
+    """action: remove drops the same rows as the original per-column loop."""
+    print("\n" + "="*80)
+    print("TESTING OUTLIER REMOVAL")
+    print("="*80)
+
+    # Heavy tails in correlated columns: removing rows for one column
+    # moves the quartiles of the next
+    rng = np.random.default_rng(7)
+    base = rng.standard_t(2, size=400)
+    df = pd.DataFrame({
+        'quantity': (np.abs(base) * 3).round().astype('int64'),
+        'price': base * 10 + rng.normal(0, 5, size=400),
+        'discount': np.where(rng.random(400) < 0.05, np.nan, rng.standard_t(3, size=400)),
+    })
+
+    failures = []
+    for method, threshold in (('iqr', 1.5), ('zscore', 2.0)):
+        cleaner = DataCleaner({'outliers': {'method': method, 'threshold': threshold, 'action': 'remove'}}, logger)
+        result = cleaner._handle_outliers(df.copy())
+        expected = baseline_remove_outliers(df.copy(), method, threshold)
+        if not result.index.equals(expected.index):
+            failures.append(f"{method}: kept {len(result)} rows, original loop keeps {len(expected)}")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return False
+    print("✅ Removed rows match the original per-column loop (iqr and zscore)")
+    return True
+
+
+def test_report_cache_key(logger):
+    """The quality report is only reused for the same data and settings."""
+    print("\n" + "="*80)
+    print("TESTING QUALITY REPORT CACHE KEY")
+    print("="*80)
+
+    df = sample_frame()
+    with tempfile.TemporaryDirectory() as tmp:
+        config = {'reporting': {'output_path': os.path.join(tmp, 'report.txt')}}
+        validator = DataValidator(config, logger)
+        key = validator._report_key('orders', df)
+
+        changed = {
+            'rows reordered': validator._report_key('orders', df.iloc[[1, 0, 2, 3]].reset_index(drop=True)),
+            'values swapped between rows': validator._report_key(
+                'orders', df.assign(quantity=[10, 2, 3, 1], price=[5.5, 1.0, 1200.0, 8.25])
+            ),
+            'column retyped': validator._report_key('orders', df.astype({'quantity': 'float64'})),
+            'validator setting changed': DataValidator(
+                {**config, 'quality_checks': {'check_duplicates': False}}, logger
+            )._report_key('orders', df),
+            'other source': validator._report_key('products', df),
+        }
+        collisions = [label for label, other in changed.items() if other == key]
+
+        # An identical frame must reuse the report written for the first one
+        validator.validate(df, 'orders', write_report=True)
+        written = os.path.getmtime(config['reporting']['output_path'])
+        os.utime(config['reporting']['output_path'], (0, 0))
+        DataValidator(config, logger).validate(df.copy(), 'orders', write_report=True)
+        reused = os.path.getmtime(config['reporting']['output_path']) == 0 and written != 0
+
+    if collisions or not reused:
+        for label in collisions:
+            print(f"❌ Report key unchanged when {label}")
+        if not reused:
+            print("❌ Report rewritten for identical data")
+        return False
+    print("✅ Report key changes with data, order, dtypes and settings")
+    return True
+
+
+def main():
+    """Run all transformer checks."""
+    print("\n" + "="*80)
+    print("ETL PIPELINE - TRANSFORMER CHECKS")
+    print("="*80)
+
+    logger = get_logger('transformer_test', {'level': 'WARNING', 'log_to_console': True, 'log_to_file': False})
+
+    results = {
+        'Outlier Removal': test_outlier_removal(logger),
+        'Report Cache Key': test_report_cache_key(logger),
+    }
+
+    # Summary
+    print("\n" + "="*80)
+    print("TEST SUMMARY")
+    print("="*80)
+    for name, passed in results.items():
+        print(f"{name}: {'✅ PASS' if passed else '❌ FAIL'}")
+    print("="*80 + "\n")
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)